@@ -1,23 +1,1574 @@
+import ast
+import functools
+import hashlib
+import os
+import sys
+import threading
+import time
+import types
+from collections import OrderedDict, namedtuple
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
 import numpy as np
-from scipy.optimize import brentq
+from scipy.optimize import brentq, minimize_scalar
+from scipy.special import lambertw
+
+# Define the functions (as named functions so they can be sent to worker processes):
+def func1(x):
+    return x**10      # Represents x raised to the 10th power
+
+def func2(x):
+    return np.exp(x)  # Represents exp(x), i.e., e^x
+
+# Log-space versions, log|f(x)| and the sign of f(x), which stay finite where the
+# functions themselves overflow (exp(x) does beyond x = 709):
+def log_func1(x):
+    return 10 * np.log(np.abs(x)), np.sign(x) ** 10
+
+def log_func2(x):
+    return x
+
+def _checked_values(func, x, values):
+    """
+    Matches the result of a vectorized call to the shape of its input. A scalar result
+    is only spread over x when func gives that same value at the first and last point
+    on its own, so a callable that reduces its input, like np.linalg.norm or .max(),
+    is not mistaken for a constant.
+    :param func: The callable that was evaluated.
+    :param x: The array it was called with.
+    :param values: Its result, as a float array.
+    :return: values, shaped like x.
+    :raises ValueError: If the result cannot be used as the values of func at x.
+    """
+    if values.shape == x.shape:
+        return values
+    if values.ndim == 0 and x.size:
+        ends = [np.asarray(func(x.flat[i]), dtype=float) for i in (0, -1)]
+        if all(np.array_equal(end, values, equal_nan=True) for end in ends):
+            return np.full(x.shape, values)
+    raise ValueError(f"Expected values shaped {x.shape}, got {values.shape}")
+
+def _evaluate_array(func, x, out=None):
+    """
+    Evaluates a callable over an array of points with a single vectorized call.
+    Points where the vectorized call fails or yields a non-finite value are
+    re-evaluated one at a time; points that still raise become NaN. A call that
+    returns values of the wrong shape counts as failed.
+    :param func: The callable to evaluate.
+    :param x: A 1-D array of input values.
+    :param out: Optional float array shaped like x to write the values into. A
+                CompiledExpression writes into it directly.
+    :return: A float array with the same shape as x (out, if given).
+    """
+    x = np.asarray(x, dtype=float)
+    with np.errstate(all='ignore'):
+        try:
+            if out is None:
+                values = _checked_values(func, x, np.asarray(func(x), dtype=float))
+            elif isinstance(func, CompiledExpression):
+                values = func(x, out=out)
+            else:
+                values = out
+                values[...] = _checked_values(func, x, np.asarray(func(x), dtype=float))
+        except Exception:
+            values = np.full(x.shape, np.nan) if out is None else out
+            values.fill(np.nan)
+
+        # Fall back to scalar evaluation only where the vectorized pass failed.
+        for i in np.flatnonzero(~np.isfinite(values)):
+            try:
+                values[i] = func(x[i])
+            except Exception:
+                values[i] = np.nan
+    return values
+
+def _find_brackets(f_values):
+    """
+    Locates the grid cells that contain a root of f using array operations.
+    A cell (i, i+1) is a bracket when f changes sign across it, and an exact
+    zero at grid point i is reported as the degenerate pair (i, i). Cells with
+    a NaN at either end are ignored. Arrays with more dimensions are scanned
+    along the last axis, one grid per row.
+    :param f_values: An array of f(x) values on a sorted grid along the last axis.
+    :return: An integer array of shape (k, 2) with bracket index pairs in ascending order.
+             For an N-D input each row starts with the N-1 leading indices, so a 2-D
+             input gives rows (row, i, j) sorted by row.
+    """
+    f_values = np.asarray(f_values, dtype=float)
+    left, right = f_values[..., :-1], f_values[..., 1:]
+    valid = ~(np.isnan(left) | np.isnan(right))
+
+    # Compare signs rather than products so tiny values cannot underflow to zero.
+    signs = np.sign(f_values)
+    zero_hit = valid & (left == 0)
+    sign_flip = valid & ~zero_hit & (signs[..., :-1] * signs[..., 1:] < 0)
+
+    *rows, idx = np.nonzero(zero_hit | sign_flip)
+    return np.column_stack((*rows, idx, idx + sign_flip[(*rows, idx)]))
+
+def _chandrupatla(func, a, b, fa, fb, xtol=1e-12, rtol=4 * np.finfo(float).eps, maxiter=100,
+                  indexed=False):
+    """
+    Refines many brackets at once with a vectorized Chandrupatla iteration.
+    Each iteration makes one call to func with the trial points of all brackets
+    that are still active, choosing between inverse quadratic interpolation and
+    bisection per bracket.
+    :param func: A vectorized callable returning f(x) for an array of points.
+    :param a: Left ends of the brackets.
+    :param b: Right ends of the brackets.
+    :param fa: f(a) for each bracket.
+    :param fb: f(b) for each bracket; must differ in sign from fa.
+    :param xtol: Absolute tolerance on the root.
+    :param rtol: Relative tolerance on the root.
+    :param maxiter: Maximum number of iterations per bracket.
+    :param indexed: If True, func is called as func(x, index), where index holds the
+                    positions of the brackets the trial points belong to.
+    :return: A tuple (x, converged, iterations) of arrays, one entry per bracket.
+    """
+    x1, x2 = np.array(a, dtype=float), np.array(b, dtype=float)
+    f1, f2 = np.array(fa, dtype=float), np.array(fb, dtype=float)
+    x3, f3 = x2.copy(), f2.copy()
+    n = x1.size
+    x_root = np.full(n, np.nan)
+    converged = np.zeros(n, dtype=bool)
+    iterations = np.zeros(n, dtype=int)
+    active = np.arange(n)
+    t = np.full(n, 0.5)
+
+    with np.errstate(all='ignore'):
+        for _ in range(maxiter):
+            if active.size == 0:
+                break
+            xt = x1 + t * (x2 - x1)
+            ft = np.asarray(func(xt, active) if indexed else func(xt), dtype=float)
+            iterations[active] += 1
+
+            # Keep the bracket around the root: x3 remembers the discarded end.
+            same = np.sign(ft) == np.sign(f1)
+            x3, f3 = np.where(same, x1, x2), np.where(same, f1, f2)
+            x2, f2 = np.where(same, x2, x1), np.where(same, f2, f1)
+            x1, f1 = xt, ft
+
+            use1 = np.abs(f1) < np.abs(f2)
+            xm, fm = np.where(use1, x1, x2), np.where(use1, f1, f2)
+            tl = (rtol * np.abs(xm) + xtol / 2) / np.abs(x2 - x1)
+            failed = ~np.isfinite(ft)
+            done = (tl > 0.5) | (fm == 0) | failed
+            x_root[active[done]] = xm[done]
+            converged[active[done]] = ~failed[done]
+
+            keep = ~done
+            active, tl = active[keep], tl[keep]
+            x1, x2, x3 = x1[keep], x2[keep], x3[keep]
+            f1, f2, f3 = f1[keep], f2[keep], f3[keep]
+
+            # Use inverse quadratic interpolation where it is safe, bisection elsewhere.
+            xi = (x1 - x2) / (x3 - x2)
+            phi = (f1 - f2) / (f3 - f2)
+            iqi = (phi ** 2 < xi) & ((1 - phi) ** 2 < 1 - xi)
+            t_iqi = (f1 / (f2 - f1) * f3 / (f2 - f3)
+                     + (x3 - x1) / (x2 - x1) * f1 / (f3 - f1) * f2 / (f3 - f2))
+            t = np.where(iqi & np.isfinite(t_iqi), t_iqi, 0.5)
+            t = np.clip(t, tl, 1 - tl)
+    return x_root, converged, iterations
+
+def _newton_bracketed(func, a, b, fa, fb, order=1, xtol=1e-12, rtol=4 * np.finfo(float).eps,
+                      maxiter=100):
+    """
+    Refines many brackets at once with a safeguarded Newton or Halley iteration.
+    Every trial point shrinks its bracket, and a step that would leave the bracket
+    (or a zero or non-finite derivative) is replaced by bisection, so each root is
+    found even where the derivative-based step misbehaves.
+    :param func: A vectorized callable returning (f, f', f'') for an array of points;
+                 f'' may be None when order is 1.
+    :param a: Left ends of the brackets.
+    :param b: Right ends of the brackets.
+    :param fa: f(a) for each bracket.
+    :param fb: f(b) for each bracket; must differ in sign from fa.
+    :param order: 1 for Newton steps, 2 for Halley steps.
+    :param xtol: Absolute tolerance on the root.
+    :param rtol: Relative tolerance on the root.
+    :param maxiter: Maximum number of iterations per bracket.
+    :return: A tuple (x, converged, iterations) of arrays, one entry per bracket.
+    """
+    a, b = np.array(a, dtype=float), np.array(b, dtype=float)
+    fa, fb = np.array(fa, dtype=float), np.array(fb, dtype=float)
+    n = a.size
+    x_root = np.full(n, np.nan)
+    converged = np.zeros(n, dtype=bool)
+    iterations = np.zeros(n, dtype=int)
+    active = np.arange(n)
+
+    with np.errstate(all='ignore'):
+        # Start from the false-position point, which uses the known end values.
+        x = a - fa * (b - a) / (fb - fa)
+        x = np.where((x > a) & (x < b), x, (a + b) / 2)
+        for _ in range(maxiter):
+            if active.size == 0:
+                break
+            f, df, d2f = func(x)
+            f, df = np.asarray(f, dtype=float), np.asarray(df, dtype=float)
+            iterations[active] += 1
+
+            # Shrink the bracket around the root.
+            same = np.sign(f) == np.sign(fa)
+            a, fa = np.where(same, x, a), np.where(same, f, fa)
+            b, fb = np.where(same, b, x), np.where(same, fb, f)
+
+            step = f / df
+            if order == 2:
+                halley = 2 * f * df / (2 * df ** 2 - f * np.asarray(d2f, dtype=float))
+                step = np.where(np.isfinite(halley), halley, step)
+            x_new = x - step
+            tol = xtol / 2 + rtol * np.abs(x)
+            # A step below tol ends the iteration even if rounding puts it on an end.
+            small = (np.abs(step) <= tol) & (x_new >= a) & (x_new <= b)
+            newton = small | ((x_new > a) & (x_new < b))
+            x_new = np.where(newton, x_new, (a + b) / 2)
+
+            failed = ~np.isfinite(f)
+            done = (f == 0) | failed | small | (b - a <= 2 * tol)
+            x_root[active[done]] = np.where(f[done] == 0, x[done], x_new[done])
+            converged[active[done]] = ~failed[done]
+
+            keep = ~done
+            active = active[keep]
+            a, b, fa, fb, x = a[keep], b[keep], fa[keep], fb[keep], x_new[keep]
+    return x_root, converged, iterations
+
+def _with_endpoints(func, a, fa, b, fb):
+    """
+    Wraps a scalar function so that evaluations at known bracket ends reuse
+    values already computed on the grid instead of calling func again.
+    :param func: The scalar callable being solved.
+    :param a: Left end of the bracket.
+    :param fa: The known value func(a).
+    :param b: Right end of the bracket.
+    :param fb: The known value func(b).
+    :return: A callable with the same values as func.
+    """
+    def cached(x):
+        if x == a:
+            return fa
+        if x == b:
+            return fb
+        return func(x)
+    return cached
+
+def _find_touch_candidates(f_values):
+    """
+    Locates grid points where |f| has a local minimum but f keeps its sign,
+    the signature of curves that touch without crossing.
+    :param f_values: A 1-D array of f(x) values on a sorted grid.
+    :return: An integer array of interior grid indices in ascending order.
+    """
+    f_values = np.asarray(f_values, dtype=float)
+    if len(f_values) < 3:
+        return np.empty(0, dtype=int)
+    left, mid, right = f_values[:-2], f_values[1:-1], f_values[2:]
+    with np.errstate(invalid='ignore'):
+        same_sign = (np.sign(left) == np.sign(mid)) & (np.sign(mid) == np.sign(right)) & (mid != 0)
+        minimum = (np.abs(mid) <= np.abs(left)) & (np.abs(mid) < np.abs(right))
+    return np.flatnonzero(same_sign & minimum) + 1
+
+def _ascending(domain):
+    """
+    Orders the ends of a domain. A reversed domain (xmin > xmax) is searched as the
+    same domain given left to right, and its roots are reported right to left, the
+    order in which a grid scan of it meets them.
+    :param domain: A tuple (xmin, xmax).
+    :return: A tuple ((xmin, xmax), reverse) with xmin <= xmax.
+    """
+    xmin, xmax = domain
+    return ((xmax, xmin), True) if xmin > xmax else ((xmin, xmax), False)
+
+def _unique_sorted(x_roots, atol, rtol=0.0, last=None):
+    """
+    Selects the distinct roots from a sorted array in linear time.
+    A root is dropped when it lies within atol + rtol * max(|x|, |x_prev|) of
+    the previously accepted root, which for sorted input is the nearest one.
+    Descending input, from a scan of a reversed domain, works the same way.
+    :param x_roots: A 1-D array of roots in ascending or descending order.
+    :param atol: Absolute tolerance for treating two roots as the same.
+    :param rtol: Relative tolerance for treating two roots as the same.
+    :param last: The last root accepted from an earlier batch, if any.
+    :return: A boolean mask selecting the roots to keep.
+    """
+    x_roots = np.asarray(x_roots, dtype=float)
+    if last is not None:
+        return _unique_sorted(np.concatenate(([last], x_roots)), atol, rtol)[1:]
+    keep = np.ones(len(x_roots), dtype=bool)
+    if len(x_roots) < 2:
+        return keep
+
+    # Fast path: no two neighbours are close, so nothing needs to be dropped.
+    gaps = np.abs(np.diff(x_roots))
+    limits = atol + rtol * np.maximum(np.abs(x_roots[:-1]), np.abs(x_roots[1:]))
+    if np.all(gaps >= limits):
+        return keep
+
+    last = x_roots[0]
+    for i in range(1, len(x_roots)):
+        x = x_roots[i]
+        if abs(x - last) < atol + rtol * max(abs(x), abs(last)):
+            keep[i] = False
+        else:
+            last = x
+    return keep
+
+def _suspicious_cells(f_values):
+    """
+    Flags grid cells that may hide a root the sign test cannot see.
+    A cell is flagged when exactly one of its ends is NaN, or when f keeps its
+    sign across it next to a local minimum of |f| whose size is no larger than
+    the nearby variation of f, so a pair of roots could sit between samples.
+    Only minima with the same sign on both sides count, and the variation is
+    taken from same-sign cells, so the sample next to a simple root is not
+    mistaken for a dip.
+    :param f_values: A 1-D array of f(x) values on a sorted grid.
+    :return: A boolean array with one entry per cell.
+    """
+    f_values = np.asarray(f_values, dtype=float)
+    abs_f = np.abs(f_values)
+    left, right = f_values[:-1], f_values[1:]
+    nan_edge = np.isnan(left) ^ np.isnan(right)
+
+    with np.errstate(invalid='ignore'):
+        same_sign = np.sign(left) * np.sign(right) > 0
+        variation = np.where(same_sign, np.abs(np.diff(f_values)), 0.0)
+        local_variation = variation.copy()
+        local_variation[1:] = np.fmax(local_variation[1:], variation[:-1])
+        local_variation[:-1] = np.fmax(local_variation[:-1], variation[1:])
+
+        minima = np.zeros(len(f_values), dtype=bool)
+        minima[1:-1] = ((abs_f[1:-1] <= abs_f[:-2]) & (abs_f[1:-1] <= abs_f[2:])
+                        & same_sign[:-1] & same_sign[1:])
+        near_minimum = minima[:-1] | minima[1:]
+        close = np.minimum(abs_f[:-1], abs_f[1:]) <= local_variation
+    return nan_edge | (same_sign & near_minimum & close)
+
+def _grid_chunks(domain, num_points, chunk_size=None, index_range=None, scratch=None):
+    """
+    Generates the points of np.linspace(xmin, xmax, num_points) in chunks.
+    Consecutive chunks share one point so that no grid cell is lost at a seam,
+    and every point has exactly the value np.linspace would give it.
+    :param domain: A tuple (xmin, xmax).
+    :param num_points: Total number of grid points.
+    :param chunk_size: Maximum number of points per chunk, or None for a single chunk.
+    :param index_range: Optional (start, stop) slice of global grid indices to generate.
+    :param scratch: Optional _ScratchPool; every chunk is then written into the same
+                    borrowed buffer and is only valid until the next one is generated.
+    :return: A generator of (offset, x_chunk) where offset is the global index of x_chunk[0].
+    """
+    xmin, xmax = domain
+    first, end = index_range if index_range is not None else (0, num_points)
+    single = first == 0 and end == num_points and (chunk_size is None or num_points <= chunk_size)
+    if single and (scratch is None or num_points < 2 or xmin == xmax):
+        yield 0, np.linspace(xmin, xmax, num_points)
+        return
+    if chunk_size is None:
+        chunk_size = end - first
+    if chunk_size < 2:
+        raise ValueError("chunk_size must be at least 2.")
+
+    step = (xmax - xmin) / (num_points - 1)
+    start = first
+    if scratch is None:
+        while start < end - 1:
+            stop = min(start + chunk_size, end)
+            x_chunk = np.arange(start, stop) * step + xmin
+            if stop == num_points:
+                x_chunk[-1] = xmax
+            yield start, x_chunk
+            start = stop - 1
+        return
+
+    # Same arithmetic as above (and as np.linspace), written into one reused buffer
+    with scratch.borrow(min(chunk_size, end - first)) as (buffer,):
+        while start < end - 1:
+            stop = min(start + chunk_size, end)
+            x_chunk = buffer[:stop - start]
+            np.add(scratch.arange(stop - start), start, out=x_chunk)
+            np.multiply(x_chunk, step, out=x_chunk)
+            np.add(x_chunk, xmin, out=x_chunk)
+            if stop == num_points:
+                x_chunk[-1] = xmax
+            yield start, x_chunk
+            start = stop - 1
+
+# The largest array length kept around for reuse by scans and compiled expressions.
+_SCRATCH_POINTS = 1 << 16
+
+class _ScratchPool:
+    """
+    Reusable float arrays for scans, bucketed by capacity in powers of two so that
+    grids of similar size share buffers. A buffer is lent out to one user at a time,
+    so interleaved generators and threads never see each other's data. Only buffers of
+    up to max_points are pooled, and at most max_bytes of them are kept; larger grids
+    get plain arrays, whose allocation cost is small next to evaluating them.
+    """
+
+    def __init__(self, keep=4, max_points=_SCRATCH_POINTS, max_bytes=8 << 20):
+        """
+        :param keep: How many free buffers to keep per capacity.
+        :param max_points: The largest buffer length that is pooled.
+        :param max_bytes: The most memory kept in free buffers.
+        """
+        self.keep = keep
+        self.max_points = max_points
+        self.max_bytes = max_bytes
+        self._free = {}
+        self._bytes = 0
+        self._range = np.arange(0, dtype=float)
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def borrow(self, n, count=1):
+        """
+        Lends out float arrays of length n for the duration of a with block.
+        :param n: The length of each array.
+        :param count: How many arrays to lend.
+        :return: A context manager yielding a list of count arrays.
+        """
+        if n > self.max_points:
+            yield [np.empty(n) for _ in range(count)]
+            return
+        capacity = 1 << max(n - 1, 0).bit_length()
+        with self._lock:
+            free = self._free.setdefault(capacity, [])
+            reused = min(count, len(free))
+            buffers = [free.pop() for _ in range(reused)]
+            self._bytes -= sum(buffer.nbytes for buffer in buffers)
+            buffers += [np.empty(capacity) for _ in range(count - reused)]
+        try:
+            yield [buffer[:n] for buffer in buffers]
+        finally:
+            with self._lock:
+                free = self._free[capacity]
+                for buffer in buffers:
+                    if len(free) >= self.keep or self._bytes + buffer.nbytes > self.max_bytes:
+                        break
+                    free.append(buffer)
+                    self._bytes += buffer.nbytes
+
+    def arange(self, n):
+        """
+        :param n: The length of the range.
+        :return: A read-only view of np.arange(n) as floats.
+        """
+        if n > self.max_points:
+            return np.arange(n, dtype=float)
+        values = self._range
+        if len(values) < n:
+            with self._lock:
+                if len(self._range) < n:
+                    self._range = np.arange(1 << max(n - 1, 0).bit_length(), dtype=float)
+                    self._range.flags.writeable = False
+                values = self._range
+        return values[:n]
+
+    def __getstate__(self):
+        return {'keep': self.keep, 'max_points': self.max_points, 'max_bytes': self.max_bytes}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+def _partition_ranges(num_points, partitions):
+    """
+    Splits the grid indices into contiguous ranges that share their end points.
+    :param num_points: Total number of grid points.
+    :param partitions: Desired number of ranges.
+    :return: A list of (start, stop) index ranges covering every grid cell once.
+    """
+    if num_points < 2:
+        return [(0, num_points)]
+    partitions = max(1, min(partitions, num_points - 1))
+    bounds = np.linspace(0, num_points - 1, partitions + 1).round().astype(int)
+    return [(int(lo), int(hi) + 1) for lo, hi in zip(bounds[:-1], bounds[1:]) if hi > lo]
+
+def _scan_partition(finder, domain, num_points, index_range, options):
+    """
+    Scans one range of grid indices; runs inside executor workers.
+    :param options: Keyword arguments for IntersectionFinder._scan_chunks.
+    :return: A tuple (x_roots, bracket, iterations, cpu_time) for the range, where
+             cpu_time is the CPU time the worker thread spent on it.
+    """
+    started = time.thread_time()
+    chunks = list(finder._scan_chunks(domain, num_points, index_range=index_range, **options))
+    x_roots, brackets, iterations = (np.concatenate([chunk[k] for chunk in chunks])
+                                     for k in range(3))
+    return x_roots, brackets, iterations, time.thread_time() - started
+
+def _chebyshev_proxy(func, a, b, max_degree, max_ratio=1e3):
+    """
+    Builds a Chebyshev interpolant of func on [a, b], doubling the degree until
+    the trailing coefficients are negligible.
+    :param func: A vectorized callable.
+    :param a: Left end of the interval.
+    :param b: Right end of the interval.
+    :param max_degree: Largest degree to try before giving up.
+    :param max_ratio: Largest allowed ratio between the biggest and the median |f|
+                      sampled; wider dynamic ranges cannot resolve the small values.
+    :return: None if the interval should be split, otherwise a tuple (coefficients, scale)
+             of Chebyshev coefficients on [-1, 1] normalized by scale = max |f| sampled.
+             The coefficients are empty if f is not finite anywhere on the interval.
+    """
+    mid, half = (a + b) / 2, (b - a) / 2
+    degree = 16
+    while degree <= max_degree:
+        nodes = np.polynomial.chebyshev.chebpts1(degree + 1)
+        values = _evaluate_array(func, mid + half * nodes)
+        finite = np.isfinite(values)
+        if not finite.any():
+            return np.empty(0), 0.0
+        if not finite.all():
+            return None
+        abs_values = np.abs(values)
+        scale = abs_values.max()
+        if scale == 0:
+            return np.zeros(1), 0.0
+        if scale / max_ratio > np.median(abs_values):
+            return None
+
+        # Interpolate the normalized values through the first-kind nodes and check the tail.
+        coefficients = np.polynomial.chebyshev.chebfit(nodes, values / scale, degree)
+        if np.abs(coefficients[-3:]).max() <= 1e3 * np.finfo(float).eps:
+            return np.polynomial.chebyshev.chebtrim(coefficients, 1e2 * np.finfo(float).eps), scale
+        degree *= 2
+    return None
+
+def _widen(lo, hi):
+    """
+    Rounds interval ends outward by one unit in the last place, so that
+    floating-point error in the end values cannot exclude part of the true range.
+    :return: A tuple (lo, hi).
+    """
+    return np.nextafter(lo, -np.inf), np.nextafter(hi, np.inf)
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+class _CachedFunction:
+    """
+    Wraps a function with a bounded cache of its values keyed on the exact float x,
+    evicting the least recently used entries. Arrays are looked up element by
+    element and all misses are evaluated in one vectorized call. Inputs that are not
+    real floats (complex steps, intervals), extra arguments and arrays with more
+    than one dimension are passed straight through.
+    """
+
+    def __init__(self, func, maxsize):
+        """
+        :param func: The function to cache.
+        :param maxsize: Maximum number of cached values.
+        """
+        self.__wrapped__ = func
+        self.maxsize = maxsize
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self._family = False
+        self.hits = 0
+        self.misses = 0
+
+    def __call__(self, x, *args):
+        func = self.__wrapped__
+        if args or isinstance(x, (bool, np.bool_)):
+            return func(x, *args)
+        if isinstance(x, (float, int, np.floating, np.integer)):
+            key = float(x)
+            with self._lock:
+                if key in self._cache:
+                    self._cache.move_to_end(key)
+                    self.hits += 1
+                    return self._cache[key]
+            value = func(x)
+            self._store([key], [value])
+            return value
+        if self._family or not (isinstance(x, np.ndarray) and x.ndim == 1
+                                 and x.dtype.kind in 'fi'):
+            return func(x)
+
+        keys = x.tolist()
+        values = np.empty(len(keys))
+        missing = []
+        with self._lock:
+            for i, key in enumerate(keys):
+                if key in self._cache:
+                    self._cache.move_to_end(key)
+                    values[i] = self._cache[key]
+                else:
+                    missing.append(i)
+            self.hits += len(keys) - len(missing)
+        if missing:
+            computed = np.asarray(func(x[missing]))
+            if computed.ndim > 1:
+                # A family returning one row per pair; its values are not per-x.
+                self._family = True
+                return func(x)
+            computed = _checked_values(func, x[missing], computed.astype(float))
+            values[missing] = computed
+            self._store([keys[i] for i in missing], computed.tolist())
+        return values
+
+    def _store(self, keys, values):
+        with self._lock:
+            self.misses += len(keys)
+            for key, value in zip(keys, values):
+                self._cache[key] = value
+                self._cache.move_to_end(key)
+            while len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+
+    def cache_info(self):
+        """
+        :return: A CacheInfo tuple (hits, misses, maxsize, currsize).
+        """
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._cache))
+
+    def cache_clear(self):
+        """
+        Empties the cache and resets its statistics.
+        """
+        with self._lock:
+            self._cache.clear()
+            self.hits = self.misses = 0
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+def _watch_points(x_grid, dx, x_coarse, watch):
+    """
+    Picks the points sampled at every continuation step: the coarse grid, plus the
+    points of the full grid within one coarse spacing of each watched minimum of |f|.
+    :param x_grid: The full, evenly spaced grid.
+    :param dx: The spacing of x_grid.
+    :param x_coarse: The coarse grid.
+    :param watch: x positions of the watched minima.
+    :return: The sorted, unique sample points.
+    """
+    width = int(np.ceil((x_coarse[-1] - x_coarse[0]) / (len(x_coarse) - 1) / dx))
+    centres = np.searchsorted(x_grid, watch)
+    indices = (centres[:, None] + np.arange(-width, width + 1)).ravel()
+    indices = indices[(indices >= 0) & (indices < len(x_grid))]
+    return np.union1d(x_coarse, x_grid[indices])
+
+def _watch_candidates(f_values):
+    """
+    Locates the minima of |f| that can give birth to roots: the touch candidates, plus
+    points next to the ends of the grid or to a NaN region whose one finite neighbour
+    has the same sign and a larger |f|.
+    :param f_values: A 1-D array of f(x) values on a sorted grid.
+    :return: An integer array of grid indices in ascending order.
+    """
+    f_values = np.concatenate(([np.nan], np.asarray(f_values, dtype=float), [np.nan]))
+    left, mid, right = f_values[:-2], f_values[1:-1], f_values[2:]
+    with np.errstate(invalid='ignore'):
+        same_sign = ((np.isnan(left) | (np.sign(left) == np.sign(mid)))
+                     & (np.isnan(right) | (np.sign(right) == np.sign(mid)))
+                     & ~(np.isnan(left) & np.isnan(right)) & (mid != 0))
+        minimum = ((np.isnan(left) | (np.abs(mid) <= np.abs(left)))
+                   & (np.isnan(right) | (np.abs(mid) < np.abs(right))))
+    return np.flatnonzero(same_sign & minimum)
+
+def _parity_agrees(x_samples, f_samples, x_roots):
+    """
+    Checks tracked roots against a sampling of f: a cell between neighbouring samples
+    where f changes sign must hold an odd number of the roots, and any other cell an
+    even number. Cells with a NaN or an exact zero at either end are not checked.
+    :param x_samples: The sorted sample points.
+    :param f_samples: f at the sample points.
+    :param x_roots: The tracked roots.
+    :return: True if every checked cell agrees.
+    """
+    signs = np.sign(f_samples)
+    checked = ~np.isnan(signs[:-1] * signs[1:]) & (signs[:-1] != 0) & (signs[1:] != 0)
+    flip = signs[:-1] != signs[1:]
+    cells = np.clip(np.searchsorted(x_samples, x_roots, side='right') - 1,
+                    0, len(x_samples) - 2)
+    odd = np.bincount(cells, minlength=len(x_samples) - 1) % 2 == 1
+    return bool(np.all(flip[checked] == odd[checked]))
+
+class _Interval:
+    """
+    A vector of closed intervals [lo, hi] with outward-rounded arithmetic.
+    Calling a function built from +, -, *, /, ** and common NumPy ufuncs with an
+    _Interval returns an _Interval enclosing the function's range on each interval.
+    An interval whose ends are both NaN is empty: the function is undefined there.
+    """
+
+    # Monotone ufuncs with the lower end of their domain, if any.
+    _increasing = {np.exp: None, np.exp2: None, np.expm1: None, np.log: 0.0, np.log2: 0.0,
+                   np.log10: 0.0, np.log1p: -1.0, np.sqrt: 0.0, np.cbrt: None,
+                   np.arctan: None, np.tanh: None, np.sinh: None, np.arcsinh: None}
+
+    def __init__(self, lo, hi):
+        self.lo = np.asarray(lo, dtype=float)
+        self.hi = np.asarray(hi, dtype=float)
+
+    @staticmethod
+    def _coerce(value):
+        if isinstance(value, _Interval):
+            return value
+        value = np.asarray(value, dtype=float)
+        return _Interval(value, value)
+
+    def __add__(self, other):
+        other = _Interval._coerce(other)
+        return _Interval(*_widen(self.lo + other.lo, self.hi + other.hi))
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        other = _Interval._coerce(other)
+        return _Interval(*_widen(self.lo - other.hi, self.hi - other.lo))
+
+    def __rsub__(self, other):
+        return _Interval._coerce(other) - self
+
+    def __neg__(self):
+        return _Interval(-self.hi, -self.lo)
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return np.absolute(self)
+
+    def __mul__(self, other):
+        other = _Interval._coerce(other)
+        products = np.array([self.lo * other.lo, self.lo * other.hi,
+                             self.hi * other.lo, self.hi * other.hi])
+        # 0 * inf is NaN; the remaining products still bound the result.
+        return _Interval(*_widen(np.fmin.reduce(products), np.fmax.reduce(products)))
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        other = _Interval._coerce(other)
+        spans_zero = (other.lo <= 0) & (other.hi >= 0)
+        reciprocal = _Interval(*_widen(1 / np.where(spans_zero, 1.0, other.hi),
+                                       1 / np.where(spans_zero, 1.0, other.lo)))
+        result = self * reciprocal
+        return _Interval(np.where(spans_zero, -np.inf, result.lo),
+                         np.where(spans_zero, np.inf, result.hi))
+
+    def __rtruediv__(self, other):
+        return _Interval._coerce(other) / self
+
+    def __pow__(self, exponent):
+        if isinstance(exponent, _Interval):
+            return np.exp(exponent * np.log(self))
+        p = float(exponent)
+        if p == 0:
+            return _Interval(np.ones_like(self.lo), np.ones_like(self.hi))
+        if p.is_integer():
+            if p < 0:
+                return 1 / self ** -p
+            lo_p, hi_p = self.lo ** p, self.hi ** p
+            if p % 2 == 1:
+                return _Interval(*_widen(lo_p, hi_p))
+            lo = np.where(self.lo >= 0, lo_p, np.where(self.hi <= 0, hi_p, 0.0))
+            return _Interval(*_widen(lo, np.maximum(lo_p, hi_p)))
+        # Non-integer powers are only defined for x >= 0.
+        empty = self.hi < 0
+        lo_p, hi_p = np.maximum(self.lo, 0.0) ** p, np.maximum(self.hi, 0.0) ** p
+        lo, hi = (lo_p, hi_p) if p > 0 else (hi_p, lo_p)
+        lo, hi = _widen(lo, hi)
+        return _Interval(np.where(empty, np.nan, lo), np.where(empty, np.nan, hi))
+
+    def __rpow__(self, base):
+        base = float(base)
+        if base <= 0:
+            raise TypeError("Interval extension of base**x needs a positive base.")
+        return np.exp(self * np.log(base))
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        if method != '__call__' or kwargs:
+            return NotImplemented
+        binary = {np.add: lambda a, b: _Interval._coerce(a) + b,
+                  np.subtract: lambda a, b: _Interval._coerce(a) - b,
+                  np.multiply: lambda a, b: _Interval._coerce(a) * b,
+                  np.true_divide: lambda a, b: _Interval._coerce(a) / b,
+                  np.power: lambda a, b: _Interval._coerce(a) ** b}
+        if ufunc in binary:
+            return binary[ufunc](*inputs)
+        (x,) = inputs
+        if ufunc in _Interval._increasing:
+            floor = _Interval._increasing[ufunc]
+            lo, hi = x.lo, x.hi
+            if floor is not None:
+                empty = hi < floor
+                lo = np.maximum(lo, floor)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                lo, hi = _widen(ufunc(lo), ufunc(hi))
+            if floor is not None:
+                lo, hi = np.where(empty, np.nan, lo), np.where(empty, np.nan, hi)
+            return _Interval(lo, hi)
+        if ufunc is np.negative:
+            return -x
+        if ufunc is np.positive:
+            return x
+        if ufunc is np.square:
+            return x ** 2
+        if ufunc in (np.absolute, np.fabs):
+            lo = np.where(x.lo >= 0, x.lo, np.where(x.hi <= 0, -x.hi, 0.0))
+            return _Interval(lo, np.maximum(np.abs(x.lo), np.abs(x.hi)))
+        if ufunc is np.cosh:
+            return np.exp(np.abs(x)) / 2 + np.exp(-np.abs(x)) / 2
+        if ufunc in (np.sin, np.cos):
+            # Extremes inside the interval are where sin(x + shift) peaks at +-1.
+            shift = 0.0 if ufunc is np.sin else np.pi / 2
+            lo, hi = _widen(np.minimum(ufunc(x.lo), ufunc(x.hi)), np.maximum(ufunc(x.lo), ufunc(x.hi)))
+            a, b = x.lo + shift, x.hi + shift
+            has_max = np.ceil((a - np.pi / 2) / (2 * np.pi)) <= np.floor((b - np.pi / 2) / (2 * np.pi))
+            has_min = np.ceil((a + np.pi / 2) / (2 * np.pi)) <= np.floor((b + np.pi / 2) / (2 * np.pi))
+            wide = x.hi - x.lo >= 2 * np.pi
+            return _Interval(np.where(has_min | wide, -1.0, np.maximum(lo, -1.0)),
+                             np.where(has_max | wide, 1.0, np.minimum(hi, 1.0)))
+        raise TypeError(f"No interval extension for numpy.{ufunc.__name__}; "
+                        f"pass interval_func1/interval_func2 instead.")
+
+class Power:
+    """
+    A structured spec for f(x) = x**n. It is an ordinary callable, and it also
+    lets IntersectionFinder solve Power-vs-Exponential pairs in closed form.
+    """
+
+    def __init__(self, n):
+        """
+        :param n: The exponent.
+        """
+        self.n = int(n) if float(n).is_integer() else float(n)
+
+    def __call__(self, x):
+        return x ** self.n
+
+    def __repr__(self):
+        return f"Power({self.n!r})"
+
+class Exponential:
+    """
+    A structured spec for f(x) = base**x (exp(x) by default). It is an ordinary
+    callable, and it also lets IntersectionFinder solve Power-vs-Exponential
+    pairs in closed form.
+    """
+
+    def __init__(self, base=np.e):
+        """
+        :param base: The positive base.
+        """
+        if base <= 0:
+            raise ValueError("The base of an Exponential must be positive.")
+        self.base = float(base)
+
+    def __call__(self, x):
+        if self.base == np.e:
+            return np.exp(x)
+        return self.base ** x
+
+    def __repr__(self):
+        return "Exponential()" if self.base == np.e else f"Exponential({self.base!r})"
+
+def _power_exponential_roots(n, base):
+    """
+    Solves x**n = base**x exactly with the real branches of the Lambert W function.
+    For x > 0 the solutions are x = -(n/k) W(-k/n) with k = ln(base); for x < 0 and
+    even integer n they are x = -(n/k) W(k/n).
+    :param n: The exponent of the power.
+    :param base: The base of the exponential.
+    :return: A sorted array of all real solutions, or None if there are infinitely many.
+    """
+    k = np.log(base)
+    if k == 0:
+        if n == 0:
+            return None
+        even = float(n).is_integer() and n % 2 == 0
+        return np.array([-1.0, 1.0]) if even else np.array([1.0])
+    if n == 0:
+        return np.array([0.0])
+
+    def branches(z):
+        # Real values of W(z) on the principal and, for -1/e <= z < 0, the lower branch.
+        if z < -1 / np.e:
+            # A tangency sits exactly on the branch point; allow for rounding in -k/n.
+            if -1 / np.e - z > 4 * np.finfo(float).eps:
+                return []
+            z = -1 / np.e
+        if z == -1 / np.e:
+            # Both branches meet at W = -1; lambertw returns NaN exactly here.
+            return [-1.0]
+        values = [lambertw(z, 0).real]
+        if z < 0:
+            values.append(lambertw(z, -1).real)
+        return values
+
+    roots = [-(n / k) * w for w in branches(-k / n)]
+    roots = [x for x in roots if x > 0]
+    if float(n).is_integer() and n % 2 == 0:
+        roots += [-(n / k) * w for w in branches(k / n) if (n / k) * w > 0]
+    return np.unique(np.array(roots, dtype=float))
+
+# Names an expression string may use, mapped to the NumPy functions they call.
+_EXPRESSION_FUNCTIONS = {
+    'exp': np.exp, 'expm1': np.expm1, 'log': np.log, 'log1p': np.log1p, 'log2': np.log2,
+    'log10': np.log10, 'sqrt': np.sqrt, 'abs': np.abs, 'sin': np.sin, 'cos': np.cos,
+    'tan': np.tan, 'arcsin': np.arcsin, 'arccos': np.arccos, 'arctan': np.arctan,
+    'sinh': np.sinh, 'cosh': np.cosh, 'tanh': np.tanh,
+}
+_EXPRESSION_CONSTANTS = {'pi': np.pi, 'e': np.e}
+_EXPRESSION_OPERATORS = {
+    ast.Add: np.add, ast.Sub: np.subtract, ast.Mult: np.multiply,
+    ast.Div: np.true_divide, ast.Pow: np.power,
+}
+
+def _parse_expression(expression):
+    """
+    Parses an expression in x, allowing only numbers, x, pi, e, the arithmetic
+    operators and the functions in _EXPRESSION_FUNCTIONS.
+    :param expression: The expression string, e.g. "x**10" or "exp(x)".
+    :return: The body of the parsed ast.Expression.
+    """
+    try:
+        tree = ast.parse(expression.strip(), mode='eval')
+    except SyntaxError as e:
+        raise ValueError(f"Invalid expression {expression!r}: {e.msg}")
+    callees = {id(node.func) for node in ast.walk(tree) if isinstance(node, ast.Call)}
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.Expression, ast.Load, ast.BinOp, ast.UnaryOp, ast.UAdd,
+                             ast.USub, *_EXPRESSION_OPERATORS)):
+            continue
+        if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+            continue
+        if isinstance(node, ast.Name) and (node.id == 'x' or node.id in _EXPRESSION_CONSTANTS
+                                           or (node.id in _EXPRESSION_FUNCTIONS
+                                               and id(node) in callees)):
+            continue
+        if (isinstance(node, ast.Call) and isinstance(node.func, ast.Name)
+                and node.func.id in _EXPRESSION_FUNCTIONS
+                and len(node.args) == 1 and not node.keywords):
+            continue
+        element = ast.unparse(node) if isinstance(node, ast.expr) else type(node).__name__
+        raise ValueError(f"Unsupported element in expression {expression!r}: {element}")
+    return tree.body
+
+def _compile_program(node):
+    """
+    Lowers a parsed expression to a straight-line program. Identical
+    subexpressions are computed once (operands of + and * are ordered so that
+    a*b and b*a match), constant subexpressions are folded, and each value is
+    assigned a buffer slot that is reused once the value is no longer needed.
+    :param node: The parsed expression from _parse_expression.
+    :return: A tuple (program, n_slots, result). program is a list of
+             (ufunc, operands, slot) steps, where an operand is ('x',), ('const', c)
+             or ('slot', i); result is the operand holding the value.
+    """
+    steps, memo = [], {}
+
+    def lower(node):
+        if isinstance(node, ast.Constant):
+            return ('const', float(node.value))
+        if isinstance(node, ast.Name):
+            return ('x',) if node.id == 'x' else ('const', _EXPRESSION_CONSTANTS[node.id])
+        if isinstance(node, ast.UnaryOp):
+            operand = lower(node.operand)
+            if isinstance(node.op, ast.UAdd):
+                return operand
+            ufunc, operands = np.negative, (operand,)
+        elif isinstance(node, ast.Call):
+            ufunc, operands = _EXPRESSION_FUNCTIONS[node.func.id], (lower(node.args[0]),)
+        else:
+            ufunc, operands = _EXPRESSION_OPERATORS[type(node.op)], (lower(node.left),
+                                                                      lower(node.right))
+            if ufunc is np.power and operands[1] == ('const', 2.0):
+                ufunc, operands = np.square, operands[:1]
+            elif ufunc is np.power and operands[1] == ('const', 0.5):
+                ufunc, operands = np.sqrt, operands[:1]
+            elif ufunc in (np.add, np.multiply):
+                operands = tuple(sorted(operands, key=repr))
+        if all(operand[0] == 'const' for operand in operands):
+            return ('const', float(ufunc(*(operand[1] for operand in operands))))
+        key = (ufunc.__name__, operands)
+        if key not in memo:
+            steps.append((ufunc, operands))
+            memo[key] = ('value', len(steps) - 1)
+        return memo[key]
+
+    result = lower(node)
+
+    # Assign buffer slots, freeing a value's slot after its last use
+    last_use = {}
+    for i, (_, operands) in enumerate(steps):
+        for operand in operands:
+            if operand[0] == 'value':
+                last_use[operand[1]] = i
+    slots, free, program, n_slots = {}, [], [], 0
+    for i, (ufunc, operands) in enumerate(steps):
+        # A value used twice by one step (a*a after CSE) must only be freed once.
+        for operand in dict.fromkeys(operands):
+            if operand[0] == 'value' and last_use[operand[1]] == i:
+                free.append(slots[operand[1]])
+        if free:
+            slots[i] = free.pop()
+        else:
+            slots[i], n_slots = n_slots, n_slots + 1
+        program.append((ufunc, tuple(('slot', slots[o[1]]) if o[0] == 'value' else o
+                                     for o in operands), slots[i]))
+    if result[0] == 'value':
+        result = ('slot', slots[result[1]])
+    return program, n_slots, result
+
+class CompiledExpression:
+    """
+    A function of x compiled from an expression string such as "x**10 - exp(x)".
+    The expression is checked against a whitelist, common subexpressions are
+    computed once, and float arrays are evaluated with NumPy ufuncs writing into
+    reusable per-thread buffers, so a call allocates only its result.
+    """
+
+    def __init__(self, expression):
+        """
+        Calling the compiled expression as f(x, out=array) writes the values into array.
+        :param expression: An expression in x using numbers, pi, e, + - * / **, and the
+                           functions exp, expm1, log, log1p, log2, log10, sqrt, abs, sin,
+                           cos, tan, arcsin, arccos, arctan, sinh, cosh and tanh.
+        """
+        self.expression = expression
+        self._program, self._n_slots, self._result = _compile_program(
+            _parse_expression(expression))
+        self._build()
+
+    def _build(self):
+        """
+        Turns the program into two plain Python functions, one that allocates its
+        values (for scalars and other inputs) and one that writes into buffers, so a
+        call runs no interpretive loop. Only names generated here appear in the source.
+        """
+        namespace, constants = {}, {}
+
+        def name(operand):
+            if operand[0] == 'x':
+                return 'x'
+            if operand[0] == 'slot':
+                return f"v{operand[1]}"
+            if operand[1] not in constants:
+                constants[operand[1]] = f"c{len(constants)}"
+                namespace[constants[operand[1]]] = operand[1]
+            return constants[operand[1]]
+
+        plain, fused = [], []
+        last = len(self._program) - 1
+        for i, (ufunc, operands, slot) in enumerate(self._program):
+            namespace[f"u{i}"] = ufunc
+            call = f"u{i}({', '.join(name(operand) for operand in operands)}"
+            plain.append(f"    v{slot} = {call})")
+            fused.append(f"    v{slot} = {call}, out={'out' if i == last else f'b[{slot}]'})")
+        result = name(self._result)
+        source = (f"def plain(x):\n{''.join(line + chr(10) for line in plain)}"
+                  f"    return {result}\n"
+                  f"def fused(x, b, out):\n{''.join(line + chr(10) for line in fused)}"
+                  f"    return {result}\n")
+        exec(compile(source, f"<expression {self.expression!r}>", 'exec'), namespace)
+        self._plain, self._fused = namespace['plain'], namespace['fused']
+        self._local = threading.local()
+
+    def _buffers(self, x):
+        # One-dimensional inputs share buffers bucketed by power-of-two capacity. Large
+        # inputs get fresh temporaries so a thread never holds on to big arrays.
+        if x.size > _SCRATCH_POINTS:
+            return [np.empty(x.shape) for _ in range(self._n_slots)]
+        n = x.shape[0] if x.ndim == 1 else None
+        key = 1 << max(n - 1, 0).bit_length() if n is not None else x.shape
+        cached = getattr(self._local, 'buffers', None)
+        if cached is None or cached[0] != key:
+            shape = (key,) if n is not None else key
+            cached = (key, [np.empty(shape) for _ in range(self._n_slots)])
+            self._local.buffers = cached
+        return cached[1] if n is None else [buffer[:n] for buffer in cached[1]]
+
+    def __call__(self, x, out=None):
+        if self._program and isinstance(x, np.ndarray) and x.dtype == np.float64 and x.ndim > 0:
+            # The last step writes into out or a fresh array, which the caller may keep.
+            result = self._fused(x, self._buffers(x), out)
+        else:
+            result = self._plain(x)
+        if out is not None and result is not out:
+            out[...] = result
+            return out
+        if self._result[0] != 'slot':
+            result = np.array(np.broadcast_to(result, np.shape(x)), dtype=float)[()]
+        if isinstance(result, np.generic) and not isinstance(x, np.generic):
+            result = result.item()
+        return result
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        for generated in ('_local', '_plain', '_fused'):
+            del state[generated]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._build()
+
+    def __fingerprint__(self):
+        # Only the source text; the generated functions and scratch buffers are not part
+        # of its identity.
+        return self.expression
+
+    def __repr__(self):
+        return f"CompiledExpression({self.expression!r})"
+
+class IntersectionResult:
+    """
+    Intersection points stored as contiguous NumPy arrays.
+    Iteration, indexing, len() and comparison behave like the list of (x, y)
+    tuples returned by find_intersections_by_scan, so existing callers keep working.
+    """
+
+    def __init__(self, x, y, residual, bracket, iterations):
+        """
+        Initialize the result from parallel arrays.
+        :param x: The x coordinates of the intersections.
+        :param y: func1 evaluated at each intersection.
+        :param residual: func1(x) - func2(x) at each intersection.
+        :param bracket: Index of the left grid point of the bracket each root came from.
+        :param iterations: Solver iterations used for each root (0 for exact grid hits).
+        """
+        self.x = np.asarray(x, dtype=float)
+        self.y = np.asarray(y, dtype=float)
+        self.residual = np.asarray(residual, dtype=float)
+        self.bracket = np.asarray(bracket, dtype=int)
+        self.iterations = np.asarray(iterations, dtype=int)
+
+    def tolist(self):
+        """
+        Converts the result to the plain list of (x, y) tuples.
+        :return: A list of tuples (x, y).
+        """
+        return list(zip(self.x.tolist(), self.y.tolist()))
+
+    def __len__(self):
+        return len(self.x)
+
+    def __iter__(self):
+        return zip(self.x.tolist(), self.y.tolist())
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return IntersectionResult(self.x[index], self.y[index], self.residual[index],
+                                      self.bracket[index], self.iterations[index])
+        return (self.x[index].item(), self.y[index].item())
+
+    def __eq__(self, other):
+        if isinstance(other, IntersectionResult):
+            return self.tolist() == other.tolist()
+        if isinstance(other, (list, tuple)):
+            return self.tolist() == list(other)
+        return NotImplemented
+
+    def __array__(self, dtype=None, copy=None):
+        return np.column_stack((self.x, self.y)).astype(dtype or float, copy=False)
+
+    def __repr__(self):
+        return f"IntersectionResult({self.tolist()!r})"
+
+class BatchIntersectionResult:
+    """
+    Intersection points of many function pairs (or of one family at many parameter
+    values), stored ragged: the roots of all pairs share flat arrays and
+    offsets[k]:offsets[k + 1] selects those of pair k. Indexing by pair gives an
+    IntersectionResult for that pair.
+    """
+
+    def __init__(self, offsets, x, y, residual, bracket, iterations):
+        """
+        Initialize the result from flat arrays.
+        :param offsets: An array of n_pairs + 1 positions delimiting each pair's roots.
+        :param x: The x coordinates of the intersections, grouped by pair.
+        :param y: func1 of the pair evaluated at each intersection.
+        :param residual: func1(x) - func2(x) at each intersection.
+        :param bracket: Index of the left grid point of the bracket each root came from.
+        :param iterations: Solver iterations used for each root (0 for exact grid hits).
+        """
+        self.offsets = np.asarray(offsets, dtype=int)
+        self.x = np.asarray(x, dtype=float)
+        self.y = np.asarray(y, dtype=float)
+        self.residual = np.asarray(residual, dtype=float)
+        self.bracket = np.asarray(bracket, dtype=int)
+        self.iterations = np.asarray(iterations, dtype=int)
+
+    @property
+    def counts(self):
+        """
+        :return: The number of intersections of each pair.
+        """
+        return np.diff(self.offsets)
+
+    @property
+    def pair(self):
+        """
+        :return: The pair index of each entry of the flat arrays.
+        """
+        return np.repeat(np.arange(len(self)), self.counts)
+
+    def tolist(self):
+        """
+        Converts the result to one list of (x, y) tuples per pair.
+        :return: A list of lists of tuples (x, y).
+        """
+        return [self[k].tolist() for k in range(len(self))]
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __iter__(self):
+        return (self[k] for k in range(len(self)))
+
+    def __getitem__(self, k):
+        k = range(len(self))[k]
+        s = slice(self.offsets[k], self.offsets[k + 1])
+        return IntersectionResult(self.x[s], self.y[s], self.residual[s],
+                                  self.bracket[s], self.iterations[s])
+
+    def __repr__(self):
+        return f"BatchIntersectionResult({len(self)} pairs, {len(self.x)} intersections)"
+
+def _available_cpus():
+    """
+    :return: The number of CPUs this process may run on.
+    """
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+class ParallelReport:
+    """
+    Timing summary of the last find_intersections_parallel call.
+    Comparing the CPU time of all workers with the wall-clock time shows how
+    much work actually overlapped; for threads this reveals whether func1 and
+    func2 release the GIL.
+    """
+
+    def __init__(self, executor, workers, wall_time, cpu_time, cpus=None):
+        """
+        :param executor: 'process', 'thread' or the name of a user-supplied executor class.
+        :param workers: Number of partitions scanned concurrently.
+        :param wall_time: Elapsed wall-clock seconds for the scan.
+        :param cpu_time: Total CPU seconds spent by the worker threads.
+        :param cpus: Number of CPUs the workers could run on; detected if None.
+        """
+        self.executor = executor
+        self.workers = workers
+        self.wall_time = wall_time
+        self.cpu_time = cpu_time
+        self.cpus = _available_cpus() if cpus is None else cpus
+
+    @property
+    def concurrency(self):
+        """
+        Average number of workers running at the same time.
+        """
+        return self.cpu_time / self.wall_time if self.wall_time > 0 else 0.0
+
+    @property
+    def achievable(self):
+        """
+        The most workers that could run at the same time on the available CPUs.
+        """
+        return min(self.workers, self.cpus)
+
+    @property
+    def released_gil(self):
+        """
+        Whether thread workers ran in parallel, i.e. the callables released the GIL:
+        True when the concurrency got more than halfway from one worker to what the
+        CPUs allow. None for process pools, where the GIL does not limit parallelism,
+        and when fewer than two workers could run at once, so overlap cannot show.
+        """
+        if self.executor != 'thread' or self.achievable < 2:
+            return None
+        return self.concurrency > (1 + self.achievable) / 2
+
+    def __repr__(self):
+        return (f"ParallelReport(executor={self.executor!r}, workers={self.workers}, "
+                f"wall_time={self.wall_time:.3g}, cpu_time={self.cpu_time:.3g}, "
+                f"cpus={self.cpus}, concurrency={self.concurrency:.2f})")
+
+def _describe(obj, seen):
+    """
+    Builds a stable description of an object for _fingerprint: functions are
+    described by their bytecode, constants, defaults, closure contents and the
+    global functions they call, never by their memory address. Other objects are
+    described by their __dict__, unless their class defines __fingerprint__(self),
+    whose return value then describes them instead; that is how callables keep
+    counters, memo tables or buffers out of their identity.
+    :param obj: The object to describe.
+    :param seen: Ids of the functions already being described, to stop recursion.
+    :return: A string.
+    """
+    if obj is None or isinstance(obj, (bool, int, float, complex, str, bytes)):
+        return repr(obj)
+    if isinstance(obj, np.generic):
+        return repr(obj.item())
+    if isinstance(obj, np.ndarray):
+        digest = hashlib.sha256(np.ascontiguousarray(obj).tobytes()).hexdigest()
+        return f"array({obj.dtype}, {obj.shape}, {digest})"
+    if isinstance(obj, (tuple, list)):
+        return f"{type(obj).__name__}({', '.join(_describe(o, seen) for o in obj)})"
+    if isinstance(obj, dict):
+        items = sorted((repr(k), _describe(v, seen)) for k, v in obj.items())
+        return f"dict({items})"
+    if isinstance(obj, types.ModuleType):
+        return f"module({obj.__name__})"
+    if isinstance(obj, np.ufunc):
+        return f"ufunc({obj.__name__})"
+    if isinstance(obj, types.CodeType):
+        return (f"code({obj.co_code.hex()}, {obj.co_names}, "
+                f"{_describe(obj.co_consts, seen)})")
+    if isinstance(obj, _CachedFunction):
+        return _describe(obj.__wrapped__, seen)
+    fingerprint = getattr(type(obj), '__fingerprint__', None)
+    if fingerprint is not None and not isinstance(obj, type):
+        return f"{type(obj).__qualname__}({_describe(fingerprint(obj), seen)})"
+    if isinstance(obj, functools.partial):
+        return f"partial({_describe((obj.func, obj.args, obj.keywords), seen)})"
+    if isinstance(obj, types.MethodType):
+        return f"method({_describe((obj.__func__, obj.__self__), seen)})"
+    if isinstance(obj, types.FunctionType):
+        if id(obj) in seen:
+            return f"function({obj.__qualname__})"
+        seen = seen | {id(obj)}
+        code = obj.__code__
+        cells = [c.cell_contents for c in obj.__closure__ or ()]
+        used = {name: obj.__globals__[name] for name in code.co_names
+                if name in obj.__globals__}
+        return (f"function({_describe(code, seen)}, {_describe(obj.__defaults__, seen)}, "
+                f"{_describe(obj.__kwdefaults__, seen)}, {_describe(cells, seen)}, "
+                f"{_describe(used, seen)})")
+    if isinstance(obj, type):
+        return f"type({obj.__module__}.{obj.__qualname__})"
+    if isinstance(obj, types.BuiltinFunctionType):
+        return f"builtin({obj.__module__}.{obj.__qualname__})"
+    name = f"{type(obj).__module__}.{type(obj).__qualname__}"
+    if hasattr(obj, '__dict__'):
+        return f"{name}({_describe(vars(obj), seen)})"
+    return name
+
+def _fingerprint(*objs):
+    """
+    Computes a fingerprint of callables and parameters that is stable across runs.
+    :param objs: The objects to fingerprint.
+    :return: A hex digest.
+    """
+    return hashlib.sha256(_describe(objs, frozenset()).encode()).hexdigest()
+
+class ResultCache:
+    """
+    A persistent cache of scan results, stored as one .npy file per result in a
+    directory. Entries are keyed on a fingerprint of the two functions together
+    with the scan parameters, so a changed function body, constant or closure
+    misses the cache. The least recently used entries are evicted once the
+    directory grows past max_bytes.
+    Callable objects are fingerprinted by their attributes, so mutable state such
+    as a call counter or a memo table changes the key and the cache never hits.
+    Such classes should define __fingerprint__(self), returning what identifies
+    them (see _describe).
+    """
+
+    def __init__(self, directory, max_bytes=64 * 2**20):
+        """
+        :param directory: The directory holding the cache; created if missing.
+        :param max_bytes: The largest total size of the cached results.
+        """
+        self.directory = os.fspath(directory)
+        self.max_bytes = max_bytes
+        os.makedirs(self.directory, exist_ok=True)
+
+    def key(self, func1, func2, **params):
+        """
+        Builds the cache key of a scan.
+        :param func1: The first function.
+        :param func2: The second function.
+        :param params: The scan parameters that affect the result.
+        :return: A string key; entries for the same functions share its prefix.
+        """
+        return f"{_fingerprint(func1, func2)[:32]}-{_fingerprint(params)[:32]}"
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.npy")
 
-# Define the functions:
-func1 = lambda x: x**10      # Represents x raised to the 10th power
-func2 = lambda x: np.exp(x)   # Represents exp(x), i.e., e^x
+    def get(self, key):
+        """
+        Looks up a cached result and marks it as recently used.
+        :param key: A key from key().
+        :return: A dict of arrays, or None on a miss.
+        """
+        path = self._path(key)
+        try:
+            record = np.load(path)
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        return {name: record[name] for name in record.dtype.names}
+
+    def put(self, key, **arrays):
+        """
+        Stores a result, then evicts old entries if the cache is too large.
+        :param key: A key from key().
+        :param arrays: The arrays to store, all of the same length. They are kept as one
+                       uncompressed record array, which loads much faster than an .npz.
+        """
+        record = np.empty(len(next(iter(arrays.values()))),
+                          dtype=[(name, array.dtype) for name, array in arrays.items()])
+        for name, array in arrays.items():
+            record[name] = array
+        path = self._path(key)
+        temp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp, 'wb') as f:
+            np.save(f, record)
+        os.replace(temp, path)
+        self._evict()
+
+    def _entries(self):
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith('.npy'):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries
+
+    def _evict(self):
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            total -= size
+
+    def invalidate(self, func1, func2):
+        """
+        Removes every cached result for a pair of functions.
+        :param func1: The first function.
+        :param func2: The second function.
+        """
+        prefix = _fingerprint(func1, func2)[:32] + '-'
+        for _, _, path in self._entries():
+            if os.path.basename(path).startswith(prefix):
+                os.remove(path)
+
+    def clear(self):
+        """
+        Removes every cached result.
+        """
+        for _, _, path in self._entries():
+            os.remove(path)
 
 class IntersectionFinder:
     """
     A class to find the intersection points of two mathematical functions.
     """
 
-    def __init__(self, func1, func2):
+    def __init__(self, func1, func2, log_func1=None, log_func2=None,
+                 interval_func1=None, interval_func2=None, dfunc1=None, dfunc2=None,
+                 d2func1=None, d2func2=None, derivative=None, cache_size=None,
+                 result_cache=None, scan_memory_points=1 << 22):
         """
         Initialize the class with two functions.
         :param func1: The first function (callable).
         :param func2: The second function (callable).
+        :param log_func1: Optional log-space version of func1 used by transform='log'.
+                          It returns log|func1(x)|, or a tuple (log|func1(x)|, sign of
+                          func1(x)); a plain return value means func1 is positive.
+        :param log_func2: Optional log-space version of func2, as for log_func1.
+        :param interval_func1: Optional interval extension of func1 used by
+                               find_intersections_interval. It maps arrays (lo, hi) to
+                               arrays (lo, hi) enclosing func1 on each [lo, hi]. If not
+                               given, func1 is called with interval arguments directly.
+        :param interval_func2: Optional interval extension of func2, as for interval_func1.
+        :param dfunc1: Optional first derivative of func1, used by method='newton'/'halley'.
+        :param dfunc2: Optional first derivative of func2.
+        :param d2func1: Optional second derivative of func1, used by method='halley'.
+        :param d2func2: Optional second derivative of func2.
+        :param derivative: 'complex-step' to differentiate functions whose derivatives
+                           are not given by evaluating them at complex points, or None.
+        :param cache_size: If set, remember up to this many values of each function,
+                           keyed on the exact x, so repeated scans on identical grids
+                           reuse earlier evaluations (other grids share few points
+                           with them). See cache_info and cache_clear.
+        :param result_cache: Optional ResultCache that find_intersections_by_scan reads
+                             and fills, so repeated scans are answered from disk.
+        :param scan_memory_points: The most samples incremental scans remember. Past it,
+                                   the memory is cut back to the samples and roots of the
+                                   latest scan.
+        """
+        if derivative not in (None, 'complex-step'):
+            raise ValueError(f"Unknown derivative mode: {derivative!r}")
+        self.func1 = func1 if cache_size is None else _CachedFunction(func1, cache_size)
+        self.func2 = func2 if cache_size is None else _CachedFunction(func2, cache_size)
+        self.log_func1 = log_func1
+        self.log_func2 = log_func2
+        self.interval_func1 = interval_func1
+        self.interval_func2 = interval_func2
+        self.dfunc1 = dfunc1
+        self.dfunc2 = dfunc2
+        self.d2func1 = d2func1
+        self.d2func2 = d2func2
+        self.derivative = derivative
+        self.result_cache = result_cache
+        self._scan_memory = {}
+        self.scan_memory_points = scan_memory_points
+        self.last_parallel_report = None
+        self._difference = None
+        self._scratch = _ScratchPool()
+
+    @classmethod
+    def from_expressions(cls, expression1, expression2, **kwargs):
+        """
+        Creates a finder from two expression strings in x, such as "x**10" and
+        "exp(x)" (see CompiledExpression for what they may contain). Besides the two
+        functions, func1(x) - func2(x) is compiled into one fused kernel that the
+        scans evaluate directly, sharing subexpressions between the two sides.
+        :param expression1: The expression of the first function.
+        :param expression2: The expression of the second function.
+        :param kwargs: Further arguments for IntersectionFinder.
+        :return: An IntersectionFinder.
+        """
+        finder = cls(CompiledExpression(expression1), CompiledExpression(expression2), **kwargs)
+        if kwargs.get('cache_size') is None:
+            # The evaluation cache sits on func1 and func2, so only fuse without it.
+            finder._difference = CompiledExpression(f"({expression1}) - ({expression2})")
+        return finder
+
+    def cache_info(self):
+        """
+        Reports the evaluation cache statistics.
+        :return: A dict mapping 'func1' and 'func2' to CacheInfo(hits, misses, maxsize,
+                 currsize), or None if the finder was created without cache_size.
         """
-        self.func1 = func1
-        self.func2 = func2
+        if not isinstance(self.func1, _CachedFunction):
+            return None
+        return {'func1': self.func1.cache_info(), 'func2': self.func2.cache_info()}
+
+    def cache_clear(self):
+        """
+        Empties the evaluation caches, if any.
+        """
+        for func in (self.func1, self.func2):
+            if isinstance(func, _CachedFunction):
+                func.cache_clear()
 
     def _equation(self, x):
         """
@@ -27,58 +1578,1202 @@ class IntersectionFinder:
         :return: The difference between func1(x) and func2(x).
         """
         try:
+            if self._difference is not None:
+                return self._difference(x)
             return self.func1(x) - self.func2(x)
         except Exception as e:
             raise ValueError(f"Error evaluating the functions at x={x}: {e}")
 
-    def find_intersections_by_scan(self, domain, num_points, tol=1e-6):
+    def _log_parts(self, func, log_func, x):
+        """
+        Evaluates log|func(x)| and the sign of func(x).
+        :param func: The function itself, used when no log-space version is given.
+        :param log_func: The log-space version of func, or None.
+        :param x: The input value(s).
+        :return: A tuple (log_abs, sign).
+        """
+        if log_func is None:
+            values = func(x)
+            return np.log(np.abs(values)), np.sign(values)
+        result = log_func(x)
+        if isinstance(result, tuple):
+            return result
+        return result, np.ones_like(result)
+
+    def _log_equation(self, x):
+        """
+        Log-space counterpart of _equation with the same sign and the same roots.
+        Where func1 and func2 share a sign s it returns s * (log|func1| - log|func2|),
+        which stays finite when the functions overflow; where their signs differ
+        only the sign of func1(x) - func2(x) matters and +-1 or +-0.5 is returned.
+        :param x: The input value.
+        :return: A value with the sign of func1(x) - func2(x), zero at intersections.
+        """
+        try:
+            with np.errstate(divide='ignore', invalid='ignore'):
+                log1, sign1 = self._log_parts(self.func1, self.log_func1, x)
+                log2, sign2 = self._log_parts(self.func2, self.log_func2, x)
+                same = sign1 * (np.asarray(log1, dtype=float) - log2)
+                same = np.where((sign1 == 0) & (sign2 == 0), 0.0, same)
+                return np.where(sign1 == sign2, same, (sign1 - sign2) / 2)[()]
+        except Exception as e:
+            raise ValueError(f"Error evaluating the functions at x={x}: {e}")
+
+    def _derivatives(self, func, dfunc, d2func, x, order):
+        """
+        Evaluates one function and its derivatives for the Newton and Halley methods.
+        Derivatives that were not supplied come from the complex step
+        f'(x) = Im f(x + ih) / h, which has no subtractive cancellation; the second
+        derivative is then a central difference of complex-step first derivatives.
+        :param func: The function.
+        :param dfunc: Its first derivative, or None.
+        :param d2func: Its second derivative, or None.
+        :param x: An array of points.
+        :param order: 1 to compute f', 2 to compute f' and f''.
+        :return: A tuple (f, f', f''), with f'' None when order is 1.
+        """
+        h = 1e-20
+        step = np.finfo(float).eps ** (1 / 3) * np.maximum(1.0, np.abs(x))
+        if (dfunc is None or (order == 2 and d2func is None)) and self.derivative is None:
+            raise ValueError("Newton and Halley refinement need dfunc1/dfunc2 (and "
+                             "d2func1/d2func2 for Halley) or derivative='complex-step'.")
+
+        def complex_step(x):
+            value = func(x + 1j * h)
+            return np.real(value), np.imag(value) / h
+
+        if dfunc is None:
+            f, df = complex_step(x)
+        else:
+            f, df = func(x), dfunc(x)
+        d2f = None
+        if order == 2:
+            if d2func is not None:
+                d2f = d2func(x)
+            elif dfunc is not None:
+                d2f = (dfunc(x + step) - dfunc(x - step)) / (2 * step)
+            else:
+                d2f = (complex_step(x + step)[1] - complex_step(x - step)[1]) / (2 * step)
+        return f, df, d2f
+
+    def _equation_derivatives(self, x, order):
+        """
+        Evaluates f(x) = func1(x) - func2(x) together with its derivatives.
+        :param x: An array of points.
+        :param order: 1 to compute f', 2 to compute f' and f''.
+        :return: A tuple (f, f', f''), with f'' None when order is 1.
+        """
+        f1, df1, d2f1 = self._derivatives(self.func1, self.dfunc1, self.d2func1, x, order)
+        f2, df2, d2f2 = self._derivatives(self.func2, self.dfunc2, self.d2func2, x, order)
+        return f1 - f2, df1 - df2, None if order == 1 else d2f1 - d2f2
+
+    def _equation_for(self, transform):
+        """
+        Selects the equation whose roots are the intersections.
+        :param transform: None for func1(x) - func2(x), or 'log' for the log-space form.
+        :return: A callable equation(x).
+        """
+        if transform is None:
+            return self._equation
+        if transform == 'log':
+            return self._log_equation
+        raise ValueError(f"Unknown transform: {transform!r}")
+
+    def _evaluate_grid(self, x_grid, vectorized=True, equation=None, out=None):
+        """
+        Evaluates the difference between the two functions on a grid.
+        :param x_grid: A 1-D array of points.
+        :param vectorized: If True, evaluate the whole grid in one call and only
+                           fall back to per-point evaluation where that fails.
+        :param equation: The equation to evaluate; defaults to _equation.
+        :param out: Optional array to write the values into.
+        :return: An array of f(x) values, with NaN where evaluation failed.
+        """
+        equation = equation or self._equation
+        if vectorized:
+            if equation == self._equation and self._difference is not None:
+                # A compiled difference kernel can write straight into out.
+                equation = self._difference
+            return _evaluate_array(equation, x_grid, out)
+
+        f_values = np.empty(len(x_grid)) if out is None else out
+        for i, x in enumerate(x_grid):
+            try:
+                f_values[i] = equation(x)
+            except Exception:
+                f_values[i] = np.nan
+        return f_values
+
+    def _refine_brackets(self, x_grid, f_values, brackets, tol, method='brentq', equation=None):
+        """
+        Refines grid brackets to roots of f(x).
+        :param x_grid: The sorted grid the brackets index into.
+        :param f_values: f(x) evaluated on x_grid; reused as the bracket end values.
+        :param brackets: An (k, 2) array of bracket index pairs from _find_brackets.
+        :param tol: Absolute tolerance on the roots.
+        :param method: 'brentq' to call scipy's brentq once per bracket,
+                       'chandrupatla' to refine all brackets together as arrays, or
+                       'newton'/'halley' for batched, bisection-safeguarded Newton or
+                       Halley steps using the derivatives given to the constructor.
+        :param equation: The equation f_values came from; defaults to _equation.
+        :return: A tuple (x_roots, found, iterations) of arrays, one entry per bracket,
+                 where found masks the brackets that converged.
+        """
+        equation = equation or self._equation
+        lo, hi = brackets[:, 0], brackets[:, 1]
+        x_roots = x_grid[lo].astype(float)
+        found = np.ones(len(brackets), dtype=bool)
+        iterations = np.zeros(len(brackets), dtype=int)
+        open_ = np.flatnonzero(lo != hi)
+
+        if method == 'brentq':
+            for k in open_:
+                a, b = x_grid[lo[k]], x_grid[hi[k]]
+                cached = _with_endpoints(equation, a, f_values[lo[k]], b, f_values[hi[k]])
+                try:
+                    x_roots[k], info = brentq(cached, a, b, xtol=tol, full_output=True)
+                    iterations[k] = info.iterations
+                except Exception:
+                    found[k] = False
+        elif method == 'chandrupatla':
+            roots, converged, iterations[open_] = _chandrupatla(
+                lambda x: _evaluate_array(equation, x),
+                x_grid[lo[open_]], x_grid[hi[open_]],
+                f_values[lo[open_]], f_values[hi[open_]], xtol=tol)
+            x_roots[open_] = roots
+            found[open_] = converged
+        elif method in ('newton', 'halley'):
+            if equation != self._equation:
+                raise ValueError(f"method={method!r} does not support transform='log'.")
+            order = 1 if method == 'newton' else 2
+            roots, converged, iterations[open_] = _newton_bracketed(
+                lambda x: self._equation_derivatives(x, order),
+                x_grid[lo[open_]], x_grid[hi[open_]],
+                f_values[lo[open_]], f_values[hi[open_]], order, xtol=tol)
+            x_roots[open_] = roots
+            found[open_] = converged
+        else:
+            raise ValueError(f"Unknown refinement method: {method!r}")
+        return x_roots, found, iterations
+
+    def _refine_touching(self, x_grid, f_values, candidates, tol, touch_tol=1e-10, equation=None):
+        """
+        Refines touching points found by _find_touch_candidates with a bounded
+        minimizer of |f| between the neighbouring grid points.
+        :param x_grid: The sorted grid the candidates index into.
+        :param f_values: f(x) evaluated on x_grid.
+        :param candidates: Interior grid indices of local minima of |f|.
+        :param tol: Absolute tolerance on the location of the minimum.
+        :param touch_tol: A minimum counts as an intersection when |f| there is at most
+                          touch_tol * max(1, |func1(x)|).
+        :param equation: The equation f_values came from; defaults to _equation. Other
+                         equations (the log-space one) are compared with touch_tol itself.
+        :return: A tuple (x_roots, found, iterations) of arrays, one entry per candidate.
+        """
+        equation = equation or self._equation
+        x_roots = x_grid[candidates].astype(float)
+        found = np.zeros(len(candidates), dtype=bool)
+        iterations = np.zeros(len(candidates), dtype=int)
+        for k, i in enumerate(candidates):
+            sign = np.sign(f_values[i])
+            try:
+                result = minimize_scalar(lambda x: sign * equation(x),
+                                         bounds=(x_grid[i - 1], x_grid[i + 1]),
+                                         method='bounded', options={'xatol': tol})
+                scale = 1.0
+                if equation == self._equation:
+                    scale = max(1.0, abs(self.func1(result.x)))
+            except Exception:
+                continue
+            x_roots[k], iterations[k] = result.x, result.nit
+            found[k] = abs(result.fun) <= touch_tol * scale
+        return x_roots, found, iterations
+
+    def _scan_chunks(self, domain, num_points, tol, rtol=0.0, vectorized=True,
+                     method='brentq', chunk_size=None, index_range=None, touching=False,
+                     transform=None):
+        """
+        Scans the domain chunk by chunk and refines each chunk's brackets before
+        moving on, so memory stays bounded by chunk_size rather than num_points.
+        The last sample of each chunk is carried into the next one.
+        :param domain: A tuple (xmin, xmax) specifying the domain to search.
+        :param num_points: Number of points to sample in the domain.
+        :param tol: Tolerance for checking convergence and uniqueness.
+        :param rtol: Relative tolerance added to tol when checking uniqueness.
+        :param vectorized: If True, evaluate each chunk in one call.
+        :param method: Root refinement method, 'brentq', 'chandrupatla', 'newton' or 'halley'.
+        :param chunk_size: Maximum number of grid points held at once, or None.
+        :param index_range: Optional (start, stop) slice of global grid indices to scan.
+        :param touching: If truthy, also report points where the curves touch without
+                         crossing; a float sets the relative |f| tolerance used to
+                         accept them (see _refine_touching).
+        :param transform: None, or 'log' to find the roots of the log-space equation.
+        :return: A generator of (x_roots, bracket, iterations) arrays per chunk, with
+                 distinct roots in scan order (descending for a reversed domain) and
+                 global bracket indices.
+        """
+        equation = self._equation_for(transform)
+        last_root = None
+        carry = None
+        previous = None
+        # x_grid and f_values live in reused scratch buffers; only the roots are new arrays.
+        first, end = index_range if index_range is not None else (0, num_points)
+        length = end - first if chunk_size is None else min(chunk_size, end - first)
+        with self._scratch.borrow(max(length, 0)) as (f_buffer,):
+            for offset, x_grid in _grid_chunks(domain, num_points, chunk_size, index_range,
+                                               self._scratch):
+                if len(x_grid) == 0:
+                    # num_points=0 gives one empty grid, with nothing to evaluate or carry
+                    yield np.empty(0), np.empty(0, dtype=int), np.empty(0, dtype=int)
+                    continue
+                # Evaluate f(x) on the chunk, reusing the sample shared with the previous one
+                f_values = f_buffer[:len(x_grid)]
+                if carry is None:
+                    self._evaluate_grid(x_grid, vectorized, equation, out=f_values)
+                else:
+                    f_values[0] = carry
+                    self._evaluate_grid(x_grid[1:], vectorized, equation, out=f_values[1:])
+                carry = f_values[-1]
+
+                # Look for sign changes in f(x) and refine each bracket
+                brackets = _find_brackets(f_values)
+                x_roots, found, iterations = self._refine_brackets(
+                    x_grid, f_values, brackets, tol, method, equation)
+                x_roots, left, iterations = x_roots[found], brackets[found, 0], iterations[found]
+
+                if touching:
+                    # Prepend the sample before the chunk so its first point can be a minimum
+                    if previous is None and offset > 0:
+                        xmin, xmax = domain
+                        x_prev = (offset - 1) * ((xmax - xmin) / (num_points - 1)) + xmin
+                        f_prev = self._evaluate_grid(np.array([x_prev]), vectorized, equation)
+                        previous = (x_prev, f_prev[0])
+                    shift = 0 if previous is None else 1
+                    x_ext = np.concatenate(([previous[0]], x_grid)) if shift else x_grid
+                    f_ext = np.concatenate(([previous[1]], f_values)) if shift else f_values
+                    previous = (x_grid[-2], f_values[-2]) if len(x_grid) > 1 else None
+
+                    candidates = _find_touch_candidates(f_ext)
+                    touch_tol = 1e-10 if touching is True else touching
+                    x_touch, found, touch_iterations = self._refine_touching(
+                        x_ext, f_ext, candidates, tol, touch_tol, equation)
+                    # Keep the roots in scan order, which is descending for a reversed domain
+                    x_roots = np.concatenate((x_roots, x_touch[found]))
+                    order = np.argsort(x_roots * np.sign(domain[1] - domain[0]), kind='stable')
+                    x_roots = x_roots[order]
+                    left = np.concatenate((left, candidates[found] - shift))[order]
+                    iterations = np.concatenate((iterations, touch_iterations[found]))[order]
+
+                # Ensure uniqueness of the intersection points; roots arrive in scan order.
+                unique = _unique_sorted(x_roots, tol, rtol, last_root)
+                x_roots, left, iterations = x_roots[unique], left[unique], iterations[unique]
+                if len(x_roots):
+                    last_root = x_roots[-1]
+                yield x_roots, left + offset, iterations
+
+    def iter_intersections(self, domain, num_points, tol=1e-6, vectorized=True, method='brentq',
+                           rtol=0.0, chunk_size=65536, max_roots=None, stop=None, touching=False,
+                           transform=None):
+        """
+        Lazily yields intersection points in the order the scan finds them, which is
+        ascending x unless the domain is reversed.
+        The domain is scanned chunk by chunk, so stopping early also stops
+        evaluating the functions on the rest of the domain.
+        :param domain: A tuple (xmin, xmax) specifying the domain to search.
+        :param num_points: Number of points to sample in the domain.
+        :param tol: Tolerance for checking convergence and uniqueness.
+        :param vectorized: If True, evaluate each chunk in one call.
+        :param method: Root refinement method, 'brentq', 'chandrupatla', 'newton' or 'halley'.
+        :param rtol: Relative tolerance added to tol when checking uniqueness.
+        :param chunk_size: Number of grid points scanned before roots are yielded.
+        :param max_roots: Stop after yielding this many intersections.
+        :param stop: A callable stop(x, y); the scan ends after the first intersection
+                     for which it returns True.
+        :param touching: If True, also yield points where the curves touch without crossing.
+        :param transform: None, or 'log' to compare the functions in log space.
+        :return: A generator of tuples (x, y).
+        """
+        if max_roots is not None and max_roots <= 0:
+            return
+        count = 0
+        for x_roots, _, _ in self._scan_chunks(domain, num_points, tol, rtol, vectorized,
+                                               method, chunk_size, touching=touching,
+                                               transform=transform):
+            y_roots = _evaluate_array(self.func1, x_roots)
+            for x_root, y_root in zip(x_roots.tolist(), y_roots.tolist()):
+                yield x_root, y_root
+                count += 1
+                if max_roots is not None and count >= max_roots:
+                    return
+                if stop is not None and stop(x_root, y_root):
+                    return
+
+    def find_intersections_by_scan(self, domain, num_points, tol=1e-6, vectorized=True,
+                                   method='brentq', rtol=0.0, structured=False, chunk_size=None,
+                                   touching=False, transform=None, analytic=True,
+                                   incremental=False):
         """
         Automatically finds intersections by scanning the specified domain.
         :param domain: A tuple (xmin, xmax) specifying the domain to search.
         :param num_points: Number of points to sample in the domain.
         :param tol: Tolerance for checking convergence and uniqueness.
-        :return: A list of tuples (x, y) representing the intersection points.
+        :param vectorized: If True, evaluate the functions on the whole grid at once.
+                           Set to False for callables that do not accept arrays.
+        :param method: Root refinement method: 'brentq', the batched 'chandrupatla', or
+                       the derivative-based 'newton' or 'halley'. Iteration counts per
+                       root are reported in the structured result.
+        :param rtol: Relative tolerance added to tol when checking uniqueness.
+        :param structured: If True, return an IntersectionResult backed by NumPy arrays
+                           that also carries residuals, bracket indices and iteration counts.
+        :param chunk_size: If given, stream the grid in chunks of at most this many points
+                           so memory does not grow with num_points.
+        :param touching: If True, also report points where the curves touch without
+                         crossing, found as local minima of |f| on the grid and refined
+                         with a bounded minimizer. A float sets the relative |f|
+                         tolerance for accepting them (default 1e-10).
+        :param transform: None to find the roots of func1(x) - func2(x), or 'log' to
+                          compare log|func1| with log|func2| (keeping track of signs),
+                          which stays finite where the functions overflow. The
+                          log-space versions given to the constructor are used if set.
+        :param analytic: If True and the functions are a Power and an Exponential spec,
+                         return the closed-form roots in the domain without scanning.
+        :param incremental: If True, reuse the samples and roots of earlier incremental
+                            scans: only the parts of the domain where the remembered
+                            samples are 1.5 or more times further apart than the
+                            requested spacing are evaluated, and only brackets not
+                            refined before are refined. Widening or zooming a scan
+                            then costs only the new points. The grid is the union of
+                            old and new samples, so bracket indices refer to it. The
+                            memory is bounded by scan_memory_points; see also
+                            reset_scan_memory.
+        :return: A list of tuples (x, y) representing the intersection points. If the
+                 finder has a result_cache, a scan it has seen before is read from it.
+        """
+        if analytic:
+            x_roots = self._analytic_roots(domain)
+            if x_roots is not None:
+                return self._package(x_roots, np.full(len(x_roots), -1),
+                                     np.zeros(len(x_roots), dtype=int), structured)
+
+        if incremental:
+            x_roots, brackets, iterations = self._scan_incremental(
+                domain, num_points, tol, rtol, vectorized, method, touching, transform)
+            return self._package(x_roots, brackets, iterations, structured)
+
+        if self.result_cache is not None:
+            key = self.result_cache.key(
+                self.func1, self.func2, scan=(tuple(domain), num_points, tol, rtol),
+                vectorized=vectorized, method=method, touching=touching, transform=transform,
+                log_funcs=(self.log_func1, self.log_func2) if transform else None,
+                derivatives=((self.dfunc1, self.dfunc2, self.d2func1, self.d2func2,
+                              self.derivative) if method in ('newton', 'halley') else None))
+            cached = self.result_cache.get(key)
+            if cached is not None:
+                result = IntersectionResult(**cached)
+                return result if structured else result.tolist()
+
+        chunks = list(self._scan_chunks(domain, num_points, tol, rtol, vectorized,
+                                        method, chunk_size, touching=touching,
+                                        transform=transform))
+        x_roots = np.concatenate([chunk[0] for chunk in chunks])
+        brackets = np.concatenate([chunk[1] for chunk in chunks])
+        iterations = np.concatenate([chunk[2] for chunk in chunks])
+        if self.result_cache is None:
+            return self._package(x_roots, brackets, iterations, structured)
+
+        result = self._package(x_roots, brackets, iterations, structured=True)
+        self.result_cache.put(key, x=result.x, y=result.y, residual=result.residual,
+                              bracket=result.bracket, iterations=result.iterations)
+        return result if structured else result.tolist()
+
+    def reset_scan_memory(self):
+        """
+        Forgets the samples and roots remembered by incremental scans.
+        """
+        self._scan_memory.clear()
+
+    def _scan_incremental(self, domain, num_points, tol, rtol, vectorized, method, touching,
+                          transform):
         """
+        Scans the domain reusing the samples and refined roots of earlier incremental
+        scans with the same transform. New points are placed evenly in every gap
+        between remembered samples that is at least 1.5 times the requested spacing.
+        :return: A tuple (x_roots, brackets, iterations) of arrays.
+        """
+        if num_points < 2:
+            # No grid cell to search, as in a plain scan
+            return np.empty(0), np.empty(0, dtype=int), np.empty(0, dtype=int)
+        equation = self._equation_for(transform)
+        memory = self._scan_memory.setdefault(
+            transform, {'x': np.empty(0), 'f': np.empty(0), 'roots': {}})
+        (xmin, xmax), reverse = _ascending(domain)
+        spacing = (xmax - xmin) / max(num_points - 1, 1)
+
+        # Fill every gap wider than the spacing with evenly placed new points
+        xs, fs = memory['x'], memory['f']
+        start, stop = np.searchsorted(xs, xmin), np.searchsorted(xs, xmax, side='right')
+        anchors = np.unique(np.concatenate(([xmin], xs[start:stop], [xmax])))
+        gaps = np.diff(anchors)
+        # Rounding leaves gaps up to 1.5 spacings alone, so a grid whose spacing is a
+        # hair finer than the remembered one does not refill the whole domain.
+        counts = np.maximum(np.round(gaps / spacing).astype(int) - 1, 0)
+        cell = np.repeat(np.arange(len(gaps)), counts)
+        step = np.arange(len(cell)) - np.repeat(np.cumsum(counts) - counts, counts) + 1
+        new = step * (gaps[cell] / (counts[cell] + 1)) + anchors[cell]
+        new = np.setdiff1d(np.concatenate((new, anchors)), xs)
+        if len(new):
+            xs = np.concatenate((xs, new))
+            fs = np.concatenate((fs, self._evaluate_grid(new, vectorized, equation)))
+            order = np.argsort(xs, kind='stable')
+            memory['x'], memory['f'] = xs, fs = xs[order], fs[order]
+            start, stop = np.searchsorted(xs, xmin), np.searchsorted(xs, xmax, side='right')
+        x_grid, f_values = xs[start:stop], fs[start:stop]
+
+        # Refine only the brackets that have not been refined before
+        brackets = _find_brackets(f_values)
+        keys = [(method, tol, a, b) for a, b in
+                zip(x_grid[brackets[:, 0]].tolist(), x_grid[brackets[:, 1]].tolist())]
+        known = np.array([key in memory['roots'] for key in keys], dtype=bool)
+        x_roots = np.empty(len(brackets))
+        found = np.empty(len(brackets), dtype=bool)
+        iterations = np.empty(len(brackets), dtype=int)
+        for k in np.flatnonzero(known):
+            x_roots[k], found[k], iterations[k] = memory['roots'][keys[k]]
+        unknown = np.flatnonzero(~known)
+        x_roots[unknown], found[unknown], iterations[unknown] = self._refine_brackets(
+            x_grid, f_values, brackets[unknown], tol, method, equation)
+        for k in unknown:
+            memory['roots'][keys[k]] = (x_roots[k], found[k], iterations[k])
+        if max(len(memory['x']), len(memory['roots'])) > self.scan_memory_points:
+            memory['x'], memory['f'] = x_grid.copy(), f_values.copy()
+            memory['roots'] = {key: memory['roots'][key] for key in keys}
+        x_roots, left, iterations = x_roots[found], brackets[found, 0], iterations[found]
+
+        if touching:
+            candidates = _find_touch_candidates(f_values)
+            touch_tol = 1e-10 if touching is True else touching
+            x_touch, found, touch_iterations = self._refine_touching(
+                x_grid, f_values, candidates, tol, touch_tol, equation)
+            order = np.argsort(np.concatenate((x_roots, x_touch[found])), kind='stable')
+            x_roots = np.concatenate((x_roots, x_touch[found]))[order]
+            left = np.concatenate((left, candidates[found]))[order]
+            iterations = np.concatenate((iterations, touch_iterations[found]))[order]
+
+        unique = _unique_sorted(x_roots, tol, rtol)
+        step = -1 if reverse else 1
+        return x_roots[unique][::step], left[unique][::step], iterations[unique][::step]
+
+    def _evaluate_pairs(self, func, n_pairs, rows, x, filler):
+        """
+        Evaluates a vectorized family at one point per entry, where entry i belongs
+        to pair rows[i]. The points are laid out as an (n_pairs, m) matrix so the
+        family is called once; unused slots hold filler.
+        :param func: A family returning (n_pairs, m) values for an (n_pairs, m) input.
+        :param n_pairs: The number of pairs in the family.
+        :param rows: Non-decreasing pair indices of the points.
+        :param x: The points.
+        :param filler: A point every pair can be evaluated at.
+        :return: An array of values, with NaN where evaluation failed.
+        """
+        cols = np.arange(len(rows)) - np.searchsorted(rows, rows)
+        grid = np.full((n_pairs, cols.max(initial=-1) + 1), filler, dtype=float)
+        grid[rows, cols] = x
+        with np.errstate(all='ignore'):
+            try:
+                values = np.broadcast_to(np.asarray(func(grid), dtype=float), grid.shape)
+            except Exception:
+                return np.full(len(rows), np.nan)
+        return values[rows, cols]
+
+    def find_intersections_batch(self, domain, num_points, tol=1e-6, rtol=0.0):
+        """
+        Finds the intersections of many function pairs at once. func1 and func2 are
+        vectorized families: given the 1-D grid they return an (n_pairs, num_points)
+        matrix (or a 1-D array shared by all pairs), and given an (n_pairs, m) matrix
+        of points they evaluate row k with pair k, as a family written with a
+        parameter column such as lambda x: x ** n[:, None] does. All pairs share one
+        grid, their brackets are found with one 2-D sign comparison, and every
+        bracket is refined in a single batched Chandrupatla solve.
+        :param domain: A tuple (xmin, xmax) specifying the domain to search.
+        :param num_points: Number of points to sample in the domain.
+        :param tol: Tolerance for checking convergence and uniqueness.
+        :param rtol: Relative tolerance added to tol when checking uniqueness.
+        :return: A BatchIntersectionResult indexed by pair.
+        """
+        xmin, xmax = domain
+        x_grid = np.linspace(xmin, xmax, num_points)
+        with np.errstate(all='ignore'):
+            f_values = np.atleast_2d(np.asarray(self._equation(x_grid), dtype=float))
+        n_pairs = len(f_values)
+
+        # Find every bracket of every pair, sorted by pair and then by x
+        brackets = _find_brackets(f_values)
+        rows, lo, hi = brackets[:, 0], brackets[:, 1], brackets[:, 2]
+        x_roots = x_grid[lo]
+        found = np.ones(len(brackets), dtype=bool)
+        iterations = np.zeros(len(brackets), dtype=int)
+        open_ = np.flatnonzero(lo != hi)
+        open_rows = rows[open_]
+        roots, converged, iterations[open_] = _chandrupatla(
+            lambda x, index: self._evaluate_pairs(self._equation, n_pairs, open_rows[index],
+                                                  x, xmin),
+            x_grid[lo[open_]], x_grid[hi[open_]],
+            f_values[open_rows, lo[open_]], f_values[open_rows, hi[open_]],
+            xtol=tol, indexed=True)
+        x_roots[open_] = roots
+        found[open_] = converged
+        rows, lo, x_roots, iterations = rows[found], lo[found], x_roots[found], iterations[found]
+
+        # Drop duplicate roots within each pair
+        same_pair = rows[1:] == rows[:-1]
+        limits = tol + rtol * np.maximum(np.abs(x_roots[:-1]), np.abs(x_roots[1:]))
+        keep = np.ones(len(x_roots), dtype=bool)
+        for k in np.unique(rows[1:][same_pair & (np.diff(x_roots) < limits)]):
+            members = np.flatnonzero(rows == k)
+            keep[members] = _unique_sorted(x_roots[members], tol, rtol)
+        rows, lo, x_roots, iterations = rows[keep], lo[keep], x_roots[keep], iterations[keep]
+
+        y = self._evaluate_pairs(self.func1, n_pairs, rows, x_roots, xmin)
+        residual = self._evaluate_pairs(self._equation, n_pairs, rows, x_roots, xmin)
+        offsets = np.searchsorted(rows, np.arange(n_pairs + 1))
+        return BatchIntersectionResult(offsets, x_roots, y, residual, lo, iterations)
+
+    def find_intersections_continuation(self, domain, parameters, num_points=1000, tol=1e-6,
+                                        rtol=0.0, rescan_every=None, coarse_points=64):
+        """
+        Tracks the intersections of a one-parameter family across a sweep of parameter
+        values. func1 and func2 take two arguments, (x, p). The first parameter is
+        solved with a full grid scan; after that each root is predicted from its last
+        two positions (secant continuation), bracketed locally, and corrected with one
+        batched Chandrupatla solve.
+        Roots are born in pairs where a local minimum of |f| touches zero, so every
+        step also samples a coarse grid, plus the full grid within one coarse spacing
+        of each minimum of |f| seen at the previous step. A sign change in these samples
+        that the tracked roots do not account for means a birth (or a root crossing the
+        ends of the domain) and repeats the full grid scan, as does a local bracket that
+        loses its sign change (roots dying). A step therefore costs coarse_points plus
+        about 2 * num_points / coarse_points evaluations per minimum and a few per root,
+        and minima too shallow to show on the coarse grid can be missed until they come
+        within reach of a watched one.
+        :param domain: A tuple (xmin, xmax) specifying the domain to search.
+        :param parameters: A sorted sequence of parameter values.
+        :param num_points: Number of points in the grid used for full scans.
+        :param tol: Tolerance for checking convergence and uniqueness.
+        :param rtol: Relative tolerance added to tol when checking uniqueness.
+        :param rescan_every: Force a full scan after this many continuation steps, or None.
+        :param coarse_points: Number of points in the coarse grid sampled at every step.
+        :return: A BatchIntersectionResult indexed by parameter; bracket is -1 for roots
+                 found by continuation rather than by a grid scan.
+        """
+        domain, reverse = _ascending(domain)
         xmin, xmax = domain
         x_grid = np.linspace(xmin, xmax, num_points)
-        f_values = []
+        x_coarse = np.linspace(xmin, xmax, max(min(coarse_points, num_points), 2))
+        dx = (xmax - xmin) / max(num_points - 1, 1)
+        results, previous, watch = [], None, None
+        since_scan = 0
 
-        # Evaluate f(x) on the grid
-        for x in x_grid:
+        for p in parameters:
+            equation = self._sweep_equation(p)
+            tracked = None
+            if previous is not None and (rescan_every is None or since_scan < rescan_every):
+                x_samples = _watch_points(x_grid, dx, x_coarse, watch)
+                f_samples = _evaluate_array(equation, x_samples)
+                tracked = self._continue_roots(equation, p, domain, dx, previous, tol, rtol)
+                if tracked is not None and _parity_agrees(x_samples, f_samples, tracked[0]):
+                    watch = x_samples[_watch_candidates(f_samples)]
+                else:
+                    tracked = None
+
+            if tracked is None:
+                # Fall back to a full scan of the grid
+                f_values = self._evaluate_grid(x_grid, equation=equation)
+                brackets = _find_brackets(f_values)
+                x_roots, found, iterations = self._refine_brackets(
+                    x_grid, f_values, brackets, tol, 'chandrupatla', equation)
+                x_roots, left, iterations = x_roots[found], brackets[found, 0], iterations[found]
+                unique = _unique_sorted(x_roots, tol, rtol)
+                x_roots, left, iterations = x_roots[unique], left[unique], iterations[unique]
+                watch = x_grid[_watch_candidates(f_values)]
+                history, since_scan = None, 0
+            else:
+                x_roots, iterations = tracked
+                left = np.full(len(x_roots), -1)
+                history, since_scan = previous, since_scan + 1
+
+            # Remember the last two positions of each root for the secant predictor
+            if history is not None and len(history[1]) == len(x_roots):
+                previous = (p, x_roots, history[0], history[1])
+            else:
+                previous = (p, x_roots, None, None)
+            y = _evaluate_array(lambda x: self.func1(x, p), x_roots)
+            row = (x_roots, y, _evaluate_array(equation, x_roots), left, iterations)
+            results.append(tuple(column[::-1] for column in row) if reverse else row)
+
+        counts = [len(r[0]) for r in results]
+        offsets = np.concatenate(([0], np.cumsum(counts, dtype=int)))
+        columns = [np.concatenate(c) for c in zip(*results)] or [[]] * 5
+        return BatchIntersectionResult(offsets, *columns)
+
+    def _sweep_equation(self, p):
+        """
+        Fixes the parameter of a two-argument family.
+        :param p: The parameter value.
+        :return: A callable equation(x) = func1(x, p) - func2(x, p).
+        """
+        def equation(x):
             try:
-                f_val = self._equation(x)
-            except Exception:
-                f_val = np.nan
-            f_values.append(f_val)
-        f_values = np.array(f_values)
+                return self.func1(x, p) - self.func2(x, p)
+            except Exception as e:
+                raise ValueError(f"Error evaluating the functions at x={x}, p={p}: {e}")
+        return equation
 
-        intersections = []
-        # Look for sign changes in f(x)
-        for i in range(len(x_grid) - 1):
-            if np.isnan(f_values[i]) or np.isnan(f_values[i+1]):
+    def _continue_roots(self, equation, p, domain, dx, previous, tol, rtol, expansions=2):
+        """
+        Performs one predictor-corrector continuation step.
+        :param equation: The equation at the new parameter value.
+        :param p: The new parameter value.
+        :param domain: A tuple (xmin, xmax).
+        :param dx: Spacing of the scan grid, the smallest local bracket half-width.
+        :param previous: A tuple (p, roots, p_before, roots_before) from the last steps.
+        :param tol: Tolerance for checking convergence and uniqueness.
+        :param rtol: Relative tolerance added to tol when checking uniqueness.
+        :param expansions: How many times a bracket without a sign change is widened.
+        :return: A tuple (x_roots, iterations), or None if a root was lost.
+        """
+        p_last, r_last, p_before, r_before = previous
+        if len(r_last) == 0:
+            return np.array([]), np.array([], dtype=int)
+
+        # Predict each root with the secant through its last two positions
+        r_pred = r_last
+        if r_before is not None and p_last != p_before:
+            r_pred = r_last + (r_last - r_before) * (p - p_last) / (p_last - p_before)
+
+        # Bracket each prediction without reaching past the neighbouring roots
+        xmin, xmax = domain
+        middles = (r_pred[:-1] + r_pred[1:]) / 2
+        lower = np.concatenate(([xmin], middles))
+        upper = np.concatenate((middles, [xmax]))
+        width = np.maximum(2 * np.abs(r_pred - r_last), dx)
+        for _ in range(expansions + 1):
+            a = np.maximum(r_pred - width, lower)
+            b = np.minimum(r_pred + width, upper)
+            ends = _evaluate_array(equation, np.concatenate((a, b)))
+            fa, fb = ends[:len(a)], ends[len(a):]
+            valid = (np.sign(fa) * np.sign(fb) < 0) | (fa == 0) | (fb == 0)
+            if valid.all():
+                break
+            width = np.where(valid, width, 4 * width)
+        else:
+            return None
+
+        x_roots, converged, iterations = _chandrupatla(
+            lambda x: _evaluate_array(equation, x), a, b, fa, fb, xtol=tol)
+        x_roots = np.where(fa == 0, a, np.where(fb == 0, b, x_roots))
+        converged |= (fa == 0) | (fb == 0)
+        if not converged.all() or not _unique_sorted(x_roots, tol, rtol).all():
+            return None
+        return x_roots, iterations
+
+    def find_intersections_parallel(self, domain, num_points, tol=1e-6, partitions=None,
+                                    executor=None, max_workers=None, vectorized=True,
+                                    method='brentq', rtol=0.0, structured=False, chunk_size=None,
+                                    touching=False, transform=None):
+        """
+        Finds intersections by scanning partitions of the domain concurrently.
+        The grid is the same as find_intersections_by_scan's, split into index
+        ranges that share their boundary points, and duplicates at the seams are
+        removed when the partial results are merged.
+        :param domain: A tuple (xmin, xmax) specifying the domain to search.
+        :param num_points: Number of points to sample in the domain.
+        :param tol: Tolerance for checking convergence and uniqueness.
+        :param partitions: Number of sub-intervals; defaults to the number of workers.
+        :param executor: 'process' (the default) to run the partitions in a new
+                         ProcessPoolExecutor, in which case func1 and func2 must be
+                         picklable (e.g. module-level functions); 'thread' to run them
+                         in a new ThreadPoolExecutor, which avoids pickling and suits
+                         callables that release the GIL; or an existing executor.
+                         The timing of the run is stored in self.last_parallel_report.
+        :param max_workers: Worker count for an executor created by this call.
+        :param vectorized: If True, evaluate each partition's grid in one call.
+        :param method: Root refinement method, 'brentq', 'chandrupatla', 'newton' or 'halley'.
+        :param rtol: Relative tolerance added to tol when checking uniqueness.
+        :param structured: If True, return an IntersectionResult.
+        :param chunk_size: Maximum number of grid points each worker holds at once.
+        :param touching: If True, also report points where the curves touch without crossing.
+        :param transform: None, or 'log' to compare the functions in log space.
+        :return: A list of tuples (x, y) representing the intersection points.
+        """
+        if executor is None:
+            executor = 'process'
+        own_executor = isinstance(executor, str)
+        if own_executor:
+            pools = {'process': ProcessPoolExecutor, 'thread': ThreadPoolExecutor}
+            if executor not in pools:
+                raise ValueError(f"Unknown executor: {executor!r}")
+            kind = executor
+            executor = pools[kind](max_workers=max_workers)
+        elif isinstance(executor, ThreadPoolExecutor):
+            kind = 'thread'
+        elif isinstance(executor, ProcessPoolExecutor):
+            kind = 'process'
+        else:
+            kind = type(executor).__name__
+
+        if partitions is None:
+            partitions = getattr(executor, '_max_workers', None) or os.cpu_count() or 1
+        ranges = _partition_ranges(num_points, partitions)
+
+        started = time.perf_counter()
+        try:
+            options = dict(tol=tol, rtol=rtol, vectorized=vectorized, method=method,
+                           chunk_size=chunk_size, touching=touching, transform=transform)
+            futures = [executor.submit(_scan_partition, self, domain, num_points, index_range,
+                                       options)
+                       for index_range in ranges]
+            parts = [future.result() for future in futures]
+        finally:
+            if own_executor:
+                executor.shutdown()
+        self.last_parallel_report = ParallelReport(
+            kind, min(len(ranges), getattr(executor, '_max_workers', len(ranges))),
+            time.perf_counter() - started, sum(part[3] for part in parts))
+
+        # Merge the partitions in order and drop roots found on both sides of a seam.
+        x_roots = np.concatenate([part[0] for part in parts])
+        brackets = np.concatenate([part[1] for part in parts])
+        iterations = np.concatenate([part[2] for part in parts])
+        unique = _unique_sorted(x_roots, tol, rtol)
+        return self._package(x_roots[unique], brackets[unique], iterations[unique], structured)
+
+    def find_intersections_adaptive(self, domain, tol=1e-6, initial_points=64, max_points=100000,
+                                    min_width=None, method='brentq', rtol=0.0, structured=False,
+                                    transform=None):
+        """
+        Finds intersections on an adaptively refined grid.
+        The scan starts from a coarse uniform grid and repeatedly bisects only the
+        cells that could be hiding roots: cells next to a dip of |f| that is small
+        compared with the local variation of f, and cells at the edge of a region
+        where f is NaN. Refinement stops when no cell is suspicious any more, when
+        every suspicious cell is narrower than min_width, or after max_points
+        evaluations; the resulting sign changes are then refined as usual.
+        :param domain: A tuple (xmin, xmax) specifying the domain to search.
+        :param tol: Tolerance for checking convergence and uniqueness.
+        :param initial_points: Number of points in the starting uniform grid.
+        :param max_points: Budget for the total number of grid evaluations.
+        :param min_width: Cells narrower than this are not subdivided; defaults to
+                          the larger of tol and 1e-9 times the domain width.
+        :param method: Root refinement method, 'brentq', 'chandrupatla', 'newton' or 'halley'.
+        :param rtol: Relative tolerance added to tol when checking uniqueness.
+        :param structured: If True, return an IntersectionResult whose bracket
+                           entries index the final adaptive grid.
+        :param transform: None, or 'log' to compare the functions in log space.
+        :return: A list of tuples (x, y) representing the intersection points.
+        """
+        equation = self._equation_for(transform)
+        (xmin, xmax), reverse = _ascending(domain)
+        if min_width is None:
+            min_width = max(tol, 1e-9 * (xmax - xmin))
+        x_grid = np.linspace(xmin, xmax, max(2, min(initial_points, max_points)))
+        f_values = self._evaluate_grid(x_grid, equation=equation)
+
+        # Bisect suspicious cells until they are resolved or the budget is spent
+        while len(x_grid) < max_points:
+            cells = np.flatnonzero(_suspicious_cells(f_values) & (np.diff(x_grid) > min_width))
+            if cells.size == 0:
+                break
+            cells = cells[:max_points - len(x_grid)]
+            midpoints = (x_grid[cells] + x_grid[cells + 1]) / 2
+            x_grid = np.insert(x_grid, cells + 1, midpoints)
+            f_values = np.insert(f_values, cells + 1,
+                                 self._evaluate_grid(midpoints, equation=equation))
+
+        brackets = _find_brackets(f_values)
+        x_roots, found, iterations = self._refine_brackets(x_grid, f_values, brackets, tol,
+                                                           method, equation)
+        x_roots, brackets, iterations = x_roots[found], brackets[found], iterations[found]
+        unique = _unique_sorted(x_roots, tol, rtol)
+        return self._package(x_roots[unique], brackets[unique, 0], iterations[unique], structured,
+                             reverse)
+
+    def find_intersections_chebyshev(self, domain, tol=1e-6, max_degree=128, min_width=None,
+                                     rtol=0.0, structured=False, transform=None):
+        """
+        Finds intersections from Chebyshev proxies of f(x) = func1(x) - func2(x).
+        The domain is split recursively until f is resolved on each piece by an
+        interpolant of degree at most max_degree. The real roots of each
+        interpolant are the real eigenvalues of its colleague matrix, and each is
+        polished on f itself. Best suited to smooth functions.
+        :param domain: A tuple (xmin, xmax) specifying the domain to search.
+        :param tol: Tolerance for checking convergence and uniqueness.
+        :param max_degree: Largest interpolant degree before an interval is split.
+        :param min_width: Intervals narrower than this are not split further and are
+                          skipped if f still cannot be resolved on them.
+        :param rtol: Relative tolerance added to tol when checking uniqueness.
+        :param structured: If True, return an IntersectionResult whose bracket entries
+                           index the final list of subintervals.
+        :param transform: None, or 'log' to build the proxies from the log-space equation,
+                          which is much better scaled for exponential-type functions.
+        :return: A list of tuples (x, y) representing the intersection points.
+        """
+        (xmin, xmax), reverse = _ascending(domain)
+        if min_width is None:
+            min_width = max(tol, 1e-12 * (xmax - xmin))
+        selected = self._equation_for(transform)
+        equation = lambda x: _evaluate_array(selected, x)
+
+        # Split the domain left to right until every piece has a converged proxy
+        estimates, pieces, scales, widths = [], [], [], []
+        stack = [(float(xmin), float(xmax))]
+        leaf = 0
+        while stack:
+            a, b = stack.pop()
+            proxy = _chebyshev_proxy(equation, a, b, max_degree)
+            if proxy is None:
+                if b - a > min_width:
+                    mid = (a + b) / 2
+                    stack.extend([(mid, b), (a, mid)])
                 continue
-            if f_values[i] == 0:
-                x_root = x_grid[i]
-            elif f_values[i] * f_values[i+1] < 0:
-                try:
-                    x_root = brentq(self._equation, x_grid[i], x_grid[i+1], xtol=tol)
-                except Exception:
-                    continue
-            else:
+            coefficients, scale = proxy
+
+            # Real roots of the proxy in [-1, 1], from its colleague matrix
+            if len(coefficients) > 1:
+                roots = np.polynomial.chebyshev.chebroots(coefficients)
+                roots = roots[np.abs(roots.imag) <= 1e-6].real
+                roots = roots[np.abs(roots) <= 1 + 1e-8]
+                estimates.append((a + b) / 2 + (b - a) / 2 * np.clip(roots, -1, 1))
+                pieces.append(np.full(len(roots), leaf))
+                scales.append(np.full(len(roots), scale))
+                widths.append(np.full(len(roots), b - a))
+            leaf += 1
+
+        if not estimates:
+            return self._package(np.empty(0), np.empty(0, dtype=int), np.empty(0, dtype=int),
+                                 structured)
+        estimates, pieces, scales, widths = (np.concatenate(estimates), np.concatenate(pieces),
+                                             np.concatenate(scales), np.concatenate(widths))
+        order = np.argsort(estimates, kind='stable')
+        estimates, pieces, scales, widths = (estimates[order], pieces[order], scales[order],
+                                             widths[order])
+
+        # Polish each estimate on f itself, widening a bracket around it tenfold at a
+        # time until f changes sign or the bracket outgrows the estimate's subinterval
+        h = np.maximum(tol, 1e-10 * np.abs(estimates))
+        a, b = estimates - h, estimates + h
+        fa, fb = equation(a), equation(b)
+        f_near = np.minimum(np.abs(fa), np.abs(fb))
+        pending = np.flatnonzero((np.sign(fa) * np.sign(fb) >= 0) & (10 * h < widths / 2))
+        while pending.size:
+            h[pending] *= 10
+            a[pending], b[pending] = estimates[pending] - h[pending], estimates[pending] + h[pending]
+            fa[pending], fb[pending] = equation(a[pending]), equation(b[pending])
+            pending = pending[(np.sign(fa[pending]) * np.sign(fb[pending]) >= 0)
+                              & (10 * h[pending] < widths[pending] / 2)]
+
+        x_roots = estimates.copy()
+        iterations = np.zeros(len(estimates), dtype=int)
+        bracketed = np.flatnonzero(np.sign(fa) * np.sign(fb) < 0)
+        roots, converged, iterations[bracketed] = _chandrupatla(
+            equation, a[bracketed], b[bracketed], fa[bracketed], fb[bracketed], xtol=tol)
+        x_roots[bracketed] = np.where(converged, roots, estimates[bracketed])
+
+        # Estimates without a sign change (touching roots) are kept only where |f| dips
+        # below both bracket ends to the noise level of the proxy
+        found = np.zeros(len(estimates), dtype=bool)
+        found[bracketed] = True
+        rest = np.flatnonzero(~found)
+        f_rest = np.abs(equation(estimates[rest]))
+        found[rest] = ((f_rest <= f_near[rest])
+                       & (f_rest <= 1e3 * np.finfo(float).eps * scales[rest]))
+
+        order = np.argsort(x_roots[found], kind='stable')
+        x_roots, pieces, iterations = (x_roots[found][order], pieces[found][order],
+                                       iterations[found][order])
+        unique = _unique_sorted(x_roots, tol, rtol)
+        return self._package(x_roots[unique], pieces[unique], iterations[unique], structured,
+                             reverse)
+
+    def _enclose(self, func, interval_func, lo, hi):
+        """
+        Encloses the range of one function on each interval [lo, hi].
+        :return: A tuple (lo, hi) of arrays.
+        """
+        if interval_func is not None:
+            f_lo, f_hi = interval_func(lo, hi)
+        else:
+            try:
+                with np.errstate(all='ignore'):
+                    result = func(_Interval(lo, hi))
+            except TypeError as e:
+                raise ValueError(f"Cannot build an interval extension of {func!r}: {e}")
+            if not isinstance(result, _Interval):
+                result = _Interval._coerce(result)
+            f_lo, f_hi = result.lo, result.hi
+        return np.broadcast_to(f_lo, lo.shape), np.broadcast_to(f_hi, lo.shape)
+
+    def find_intersections_interval(self, domain, tol=1e-6, min_width=None, max_intervals=100000,
+                                    method='brentq', rtol=0.0, structured=False):
+        """
+        Finds intersections after discarding root-free regions with interval arithmetic.
+        The domain is bisected recursively; any piece on which the interval
+        enclosure of func1 - func2 excludes zero provably holds no intersection
+        and is dropped without sampling. Pieces that survive down to min_width are
+        then sampled at their ends and midpoints, sign changes are refined, and
+        touching points are searched for as in find_intersections_by_scan.
+        :param domain: A tuple (xmin, xmax) specifying the domain to search.
+        :param tol: Tolerance for checking convergence and uniqueness.
+        :param min_width: Pieces narrower than this are not bisected further; defaults
+                          to the larger of tol and 1e-9 times the domain width.
+        :param max_intervals: Maximum number of pieces kept at once. When bisecting would
+                              exceed it, the current pieces are sampled as they are.
+        :param method: Root refinement method, 'brentq', 'chandrupatla', 'newton' or 'halley'.
+        :param rtol: Relative tolerance added to tol when checking uniqueness.
+        :param structured: If True, return an IntersectionResult whose bracket entries
+                           index the grid of sampled points.
+        :return: A list of tuples (x, y) representing the intersection points.
+        """
+        (xmin, xmax), reverse = _ascending(domain)
+        if min_width is None:
+            min_width = max(tol, 1e-9 * (xmax - xmin))
+
+        # Bisect, dropping pieces whose enclosure of f excludes zero
+        lo, hi = np.array([float(xmin)]), np.array([float(xmax)])
+        leaves_lo, leaves_hi = [], []
+        while lo.size:
+            l1, h1 = self._enclose(self.func1, self.interval_func1, lo, hi)
+            l2, h2 = self._enclose(self.func2, self.interval_func2, lo, hi)
+            f_lo, f_hi = _widen(l1 - h2, h1 - l2)
+            with np.errstate(invalid='ignore'):
+                excluded = (f_lo > 0) | (f_hi < 0) | (np.isnan(f_lo) & np.isnan(f_hi))
+            lo, hi = lo[~excluded], hi[~excluded]
+
+            done = hi - lo <= min_width
+            if 2 * np.count_nonzero(~done) + sum(map(len, leaves_lo)) > max_intervals:
+                done[:] = True
+            leaves_lo.append(lo[done])
+            leaves_hi.append(hi[done])
+            lo, hi = lo[~done], hi[~done]
+            mid = (lo + hi) / 2
+            lo, hi = np.concatenate((lo, mid)), np.concatenate((mid, hi))
+
+        leaves_lo, leaves_hi = np.concatenate(leaves_lo), np.concatenate(leaves_hi)
+        if leaves_lo.size == 0:
+            return self._package(np.empty(0), np.empty(0, dtype=int), np.empty(0, dtype=int),
+                                 structured)
+        order = np.argsort(leaves_lo)
+        leaves_lo, leaves_hi = leaves_lo[order], leaves_hi[order]
+
+        # Sample each surviving piece at its ends and midpoint. Runs of adjacent pieces
+        # share end points; a NaN sample separates runs so no bracket spans a gap.
+        n = len(leaves_lo)
+        gaps = leaves_hi[:-1] != leaves_lo[1:]
+        ends = np.append(gaps, True)
+        x_grid = np.column_stack((leaves_lo, (leaves_lo + leaves_hi) / 2)).ravel()
+        insert_at = np.concatenate((2 * (np.flatnonzero(ends) + 1), 2 * (np.flatnonzero(gaps) + 1)))
+        insert_x = np.concatenate((leaves_hi[ends], leaves_hi[:-1][gaps]))
+        separator = np.concatenate((np.zeros(np.count_nonzero(ends), dtype=bool),
+                                    np.ones(np.count_nonzero(gaps), dtype=bool)))
+        order = np.lexsort((separator, insert_at))
+        x_grid = np.insert(x_grid, insert_at[order], insert_x[order])
+        separator = np.insert(np.zeros(2 * n, dtype=bool), insert_at[order], separator[order])
+        f_values = np.full(len(x_grid), np.nan)
+        f_values[~separator] = self._evaluate_grid(x_grid[~separator])
+
+        brackets = _find_brackets(f_values)
+        x_roots, found, iterations = self._refine_brackets(x_grid, f_values, brackets, tol, method)
+        x_roots, left, iterations = x_roots[found], brackets[found, 0], iterations[found]
+
+        # A run of pieces without a sign change may still hold a touching point, so
+        # minimize |f| over each such run between its end points
+        starts = np.flatnonzero(np.diff(np.concatenate(([True], separator)).astype(int)) == -1)
+        stops = np.flatnonzero(np.diff(np.concatenate((separator, [True])).astype(int)) == 1)
+        bracket_left = brackets[:, 0]
+        touch_grid, touch_f, candidates = [], [], []
+        for start, stop in zip(starts, stops):
+            run = np.abs(f_values[start:stop + 1])
+            has_root = (np.searchsorted(bracket_left, stop, 'right')
+                        > np.searchsorted(bracket_left, start, 'left'))
+            if has_root or np.all(np.isnan(run)):
                 continue
+            best = start + np.nanargmin(run)
+            candidates.append(best)
+            touch_grid.extend((x_grid[start], x_grid[best], x_grid[stop]))
+            touch_f.extend((f_values[start], f_values[best], f_values[stop]))
+        candidates = np.array(candidates, dtype=int)
+        x_touch, found, touch_iterations = self._refine_touching(
+            np.array(touch_grid), np.array(touch_f), 3 * np.arange(len(candidates)) + 1, tol)
+        x_roots = np.concatenate((x_roots, x_touch[found]))
+        order = np.argsort(x_roots, kind='stable')
+        x_roots = x_roots[order]
+        left = np.concatenate((left, candidates[found]))[order]
+        iterations = np.concatenate((iterations, touch_iterations[found]))[order]
+
+        unique = _unique_sorted(x_roots, tol, rtol)
+        return self._package(x_roots[unique], left[unique], iterations[unique], structured,
+                             reverse)
 
-            # Ensure uniqueness of the intersection point.
-            if not any(abs(x_root - existing_x) < tol for existing_x, _ in intersections):
-                y_root = self.func1(x_root)  # At an intersection, func1(x) equals func2(x)
-                intersections.append((x_root, y_root))
+    def _analytic_roots(self, domain):
+        """
+        Solves the intersection problem in closed form when it has a known form.
+        :param domain: A tuple (xmin, xmax).
+        :return: The roots inside the domain in scan order, or None if no closed form
+                 applies.
+        """
+        func1 = getattr(self.func1, '__wrapped__', self.func1)
+        func2 = getattr(self.func2, '__wrapped__', self.func2)
+        specs = {type(func1): func1, type(func2): func2}
+        if set(specs) != {Power, Exponential}:
+            return None
+        roots = _power_exponential_roots(specs[Power].n, specs[Exponential].base)
+        if roots is None:
+            return None
+        (xmin, xmax), reverse = _ascending(domain)
+        roots = roots[(roots >= xmin) & (roots <= xmax)]
+        return roots[::-1] if reverse else roots
+
+    def _package(self, x_roots, brackets, iterations, structured, reverse=False):
+        """
+        Builds the value returned by the public find methods.
+        :param x_roots: Distinct roots, ascending unless reverse is given.
+        :param brackets: Left grid index of the bracket each root came from.
+        :param iterations: Solver iterations used for each root.
+        :param structured: If True, return an IntersectionResult; otherwise a list.
+        :param reverse: If True, report the roots in descending order (see _ascending).
+        :return: An IntersectionResult or a list of tuples (x, y).
+        """
+        if reverse:
+            x_roots, brackets, iterations = x_roots[::-1], brackets[::-1], iterations[::-1]
+        if structured:
+            y_roots = _evaluate_array(self.func1, x_roots)
+            residual = y_roots - _evaluate_array(self.func2, x_roots)
+            return IntersectionResult(x_roots, y_roots, residual, brackets, iterations)
+
+        intersections = []
+        for x_root in x_roots.tolist():
+            y_root = self.func1(x_root)  # At an intersection, func1(x) equals func2(x)
+            intersections.append((x_root, y_root))
         return intersections
 
-def main():
-    # Updated header message to match the defined functions.
-    print("Finding intersections between f(x) = x^10 and g(x) = exp(x)...\n")
-    
-    # Create an instance of IntersectionFinder using the defined functions.
-    finder = IntersectionFinder(func1, func2)
+def _order_changes(values):
+    """
+    Finds the pairs of curves that may cross in each grid cell. Ranking the curves
+    at every sample shows the cells where their vertical order changes; two curves
+    can only swap there if one of them moves in the ranking and the other sits
+    between its old and new rank, so each changed cell only compares the curves in
+    that window of ranks. Cells with tied values are checked as well.
+    :param values: An (n_curves, n_points) array of curve values on a shared grid.
+    :return: An integer array of shape (k, 4) with rows (i, j, lo, hi), i < j, where
+             curve i - curve j changes sign over the cell (lo, hi), or is exactly zero
+             at lo, in which case hi equals lo.
+    """
+    n_curves, n_points = values.shape
+    ranks = np.empty_like(values, dtype=int)
+    np.put_along_axis(ranks, np.argsort(values, axis=0, kind='stable'),
+                      np.arange(n_curves)[:, None], axis=0)
+    ordered = np.sort(values, axis=0)
+    ties = np.any(np.diff(ordered, axis=0) == 0, axis=0)
+    changed = np.any(ranks[:, :-1] != ranks[:, 1:], axis=0) | ties[:-1]
+
+    found = []
+    for t in np.flatnonzero(changed):
+        moved = ranks[:, t] != ranks[:, t + 1]
+        if moved.any():
+            low = min(ranks[moved, t].min(), ranks[moved, t + 1].min())
+            high = max(ranks[moved, t].max(), ranks[moved, t + 1].max())
+            window = np.flatnonzero((ranks[:, t] >= low) & (ranks[:, t] <= high))
+        else:
+            window = np.arange(n_curves)
+        left, right = values[window, t], values[window, t + 1]
+        with np.errstate(invalid='ignore'):
+            d_left = left[:, None] - left[None, :]
+            d_right = right[:, None] - right[None, :]
+        i, j = np.triu_indices(len(window), 1)
+        d_left, d_right = d_left[i, j], d_right[i, j]
+        valid = ~(np.isnan(d_left) | np.isnan(d_right))
+        zero_hit = valid & (d_left == 0)
+        sign_flip = valid & ~zero_hit & (np.sign(d_left) * np.sign(d_right) < 0)
+        hit = zero_hit | sign_flip
+        found.append(np.column_stack((window[i[hit]], window[j[hit]],
+                                      np.full(hit.sum(), t), t + sign_flip[hit])))
+    if not found:
+        return np.empty((0, 4), dtype=int)
+    brackets = np.concatenate(found)
+    return brackets[np.lexsort((brackets[:, 2], brackets[:, 1], brackets[:, 0]))]
+
+def find_pairwise_intersections(funcs, domain, num_points, tol=1e-6, rtol=0.0,
+                                structured=False):
+    """
+    Finds the intersections of every pair among N curves. Each curve is evaluated
+    once on a shared grid (N evaluations instead of N(N-1)/2 pairwise scans), only
+    the pairs whose vertical order swaps between neighbouring samples are refined,
+    and all of their brackets are solved together, one call per curve per iteration.
+    :param funcs: A sequence of callables.
+    :param domain: A tuple (xmin, xmax) specifying the domain to search.
+    :param num_points: Number of points to sample in the domain.
+    :param tol: Tolerance for checking convergence and uniqueness.
+    :param rtol: Relative tolerance added to tol when checking uniqueness.
+    :param structured: If True, return an IntersectionResult per pair instead of a list.
+    :return: A dict mapping each pair of indices (i, j), i < j, that intersects to its
+             intersection points (x, funcs[i](x)) in scan order, which is ascending
+             unless the domain is reversed.
+    """
+    xmin, xmax = domain
+    x_grid = np.linspace(xmin, xmax, num_points)
+    values = np.empty((len(funcs), len(x_grid)))
+    for k, func in enumerate(funcs):
+        values[k] = _evaluate_array(func, x_grid)
+    brackets = _order_changes(values)
+    first, second, lo, hi = brackets.T
+
+    def evaluate(x, index):
+        # Difference funcs[i] - funcs[j] per point, calling each curve once
+        f = np.zeros(len(x))
+        i, j = first[index], second[index]
+        for c in np.unique(np.concatenate((i, j))):
+            use = (i == c) | (j == c)
+            f[use] += np.where(i[use] == c, 1, -1) * _evaluate_array(funcs[c], x[use])
+        return f
+
+    x_roots = x_grid[lo].astype(float)
+    found = np.ones(len(brackets), dtype=bool)
+    iterations = np.zeros(len(brackets), dtype=int)
+    open_ = np.flatnonzero(lo != hi)
+    f_lo = values[first, lo] - values[second, lo]
+    f_hi = values[first, hi] - values[second, hi]
+    roots, converged, iterations[open_] = _chandrupatla(
+        lambda x, index: evaluate(x, open_[index]), x_grid[lo[open_]], x_grid[hi[open_]],
+        f_lo[open_], f_hi[open_], xtol=tol, indexed=True)
+    x_roots[open_] = roots
+    found[open_] = converged
+
+    intersections = {}
+    for i, j in sorted(set(zip(first[found].tolist(), second[found].tolist()))):
+        members = np.flatnonzero(found & (first == i) & (second == j))
+        members = members[_unique_sorted(x_roots[members], tol, rtol)]
+        finder = IntersectionFinder(funcs[i], funcs[j])
+        intersections[(i, j)] = finder._package(x_roots[members], lo[members],
+                                                iterations[members], structured)
+    return intersections
+
+def main(argv=None):
+    # Expressions may be given on the command line, e.g. python main.py "x**10" "exp(x)".
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) == 2:
+        try:
+            finder = IntersectionFinder.from_expressions(argv[0], argv[1])
+        except ValueError as e:
+            print(e)
+            return
+        print(f"Finding intersections between f(x) = {argv[0]} and g(x) = {argv[1]}...\n")
+        transform = None
+    else:
+        print("Finding intersections between f(x) = x^10 and g(x) = exp(x)...\n")
+
+        # Create an instance of IntersectionFinder using the defined functions and their
+        # log-space versions, so wide domains do not overflow exp(x).
+        finder = IntersectionFinder(func1, func2, log_func1, log_func2)
+        transform = 'log'
     
     # Prompt the user for the domain.
     while True:
@@ -114,7 +2809,7 @@ def main():
         num_points = default_points
 
     # Find and display the intersection points.
-    intersections = finder.find_intersections_by_scan(domain, num_points)
+    intersections = finder.find_intersections_by_scan(domain, num_points, transform=transform)
     print("\nResults:")
     if intersections:
         print("Intersection points (rounded to one decimal place):")
@@ -0,0 +1,325 @@
+import numpy as np
+import pytest
+from scipy.optimize import brentq
+
+from main import (CompiledExpression, Exponential, IntersectionFinder, Power, ResultCache,
+                  find_pairwise_intersections)
+
+
+def dense_roots(func1, func2, domain, num_points=200001):
+    """
+    Reference roots: every exact zero and sign change on a dense grid, the latter
+    refined with brentq.
+    """
+    x = np.linspace(*domain, num_points)
+    with np.errstate(all='ignore'):
+        f = func1(x) - func2(x)
+    cells = np.flatnonzero(np.sign(f[:-1]) * np.sign(f[1:]) < 0)
+    refined = [brentq(lambda t: func1(t) - func2(t), x[i], x[i + 1], xtol=1e-13)
+               for i in cells]
+    return np.sort(np.concatenate((refined, x[f == 0])))
+
+
+def roots_of(intersections):
+    return np.array([x for x, _ in intersections])
+
+
+# Known pairs with simple roots: periodic, polynomial, and one spanning 15 orders of magnitude.
+PAIRS = {
+    "sin-cos": (np.sin, np.cos, (0, 20)),
+    "cubic": (lambda x: x ** 3 - 2 * x, lambda x: np.full(np.shape(x), 0.5), (-3, 3)),
+    "power-exp": (lambda x: x ** 10, np.exp, (-10, 40)),
+}
+
+ENGINES = {
+    "brentq": lambda finder, domain: finder.find_intersections_by_scan(domain, 2000),
+    "chandrupatla": lambda finder, domain: finder.find_intersections_by_scan(
+        domain, 2000, method='chandrupatla'),
+    "chunked": lambda finder, domain: finder.find_intersections_by_scan(
+        domain, 2000, chunk_size=97),
+    "iter": lambda finder, domain: list(finder.iter_intersections(domain, 2000, chunk_size=97)),
+    "touching": lambda finder, domain: finder.find_intersections_by_scan(
+        domain, 2000, touching=True),
+    "log": lambda finder, domain: finder.find_intersections_by_scan(domain, 2000, transform='log'),
+    "incremental": lambda finder, domain: finder.find_intersections_by_scan(
+        domain, 2000, incremental=True),
+    "threads": lambda finder, domain: finder.find_intersections_parallel(
+        domain, 2000, partitions=3, executor='thread'),
+    "adaptive": lambda finder, domain: finder.find_intersections_adaptive(domain),
+    "chebyshev": lambda finder, domain: finder.find_intersections_chebyshev(domain),
+    "chebyshev-log": lambda finder, domain: finder.find_intersections_chebyshev(
+        domain, transform='log'),
+    "interval": lambda finder, domain: finder.find_intersections_interval(domain),
+}
+
+# Expressions with repeated subexpressions, next to the same expression written with NumPy.
+REPEATED = [
+    ("sin(x)*sin(x)+cos(x)**2", lambda x: np.sin(x) * np.sin(x) + np.cos(x) ** 2),
+    ("(x+1)*(x+1)", lambda x: (x + 1) * (x + 1)),
+    ("(x+1)*(x+1) - (2*x+3)", lambda x: (x + 1) * (x + 1) - (2 * x + 3)),
+    ("sin(x)*sin(x)+cos(x)", lambda x: np.sin(x) * np.sin(x) + np.cos(x)),
+    ("exp(x)*exp(x)*exp(x) + exp(x)", lambda x: np.exp(x) * np.exp(x) * np.exp(x) + np.exp(x)),
+    ("x*sin(x) + sin(x)*x - sin(x)**2", lambda x: x * np.sin(x) + np.sin(x) * x - np.sin(x) ** 2),
+    ("(x*x)*(x*x) + x*x", lambda x: (x * x) * (x * x) + x * x),
+]
+
+
+@pytest.mark.parametrize("expression, reference", REPEATED)
+def test_compiled_expression_matches_numpy(expression, reference):
+    compiled = CompiledExpression(expression)
+    x = np.linspace(-3, 3, 101)
+    np.testing.assert_allclose(compiled(x), reference(x), rtol=1e-12)
+    np.testing.assert_allclose(compiled(x), reference(x), rtol=1e-12)
+    for point in (-1.5, 0.0, 1.0):
+        assert compiled(point) == pytest.approx(reference(point), rel=1e-12)
+
+
+def test_from_expressions_matches_callables():
+    compiled = IntersectionFinder.from_expressions("(x+1)*(x+1)", "2*x+3")
+    plain = IntersectionFinder(lambda x: (x + 1) * (x + 1), lambda x: 2 * x + 3)
+    expected = plain.find_intersections_by_scan((-5, 5), 1000)
+    assert len(expected) == 2
+    assert np.allclose(compiled.find_intersections_by_scan((-5, 5), 1000), expected)
+
+
+def test_result_cache_key_of_compiled_finder_is_stable(tmp_path):
+    cache = ResultCache(tmp_path)
+    finder = IntersectionFinder.from_expressions("x**2", "2*x+3", result_cache=cache)
+    before = cache.key(finder.func1, finder.func2, scan=1)
+    first = finder.find_intersections_by_scan((-5, 5), 1000)
+    assert cache.key(finder.func1, finder.func2, scan=1) == before
+    assert finder.find_intersections_by_scan((-5, 5), 1000) == first
+    assert len(list(tmp_path.iterdir())) == 1
+    assert before != cache.key(CompiledExpression("x**3"), finder.func2, scan=1)
+
+
+def test_continuation_matches_fresh_scans():
+    # Two roots of x**k = exp(x) are born at k = e, between two full scans.
+    finder = IntersectionFinder(lambda x, k: x ** k, lambda x, k: np.exp(x))
+    parameters = np.linspace(1, 30, 300)
+    sweep = finder.find_intersections_continuation((-10, 100), parameters, 1000, tol=1e-10)
+    for i, k in enumerate(parameters):
+        scan = IntersectionFinder(lambda x: x ** k, np.exp).find_intersections_by_scan(
+            (-10, 100), 1000, tol=1e-10, method='chandrupatla')
+        np.testing.assert_allclose(sweep.x[sweep.offsets[i]:sweep.offsets[i + 1]],
+                                   [x for x, _ in scan], atol=1e-8)
+
+
+def test_large_scans_do_not_keep_scratch_buffers():
+    finder = IntersectionFinder.from_expressions("sin(x)", "0.3")
+    small = finder.find_intersections_by_scan((0, 100), 1000)
+    large = finder.find_intersections_by_scan((0, 100), 1 << 18)
+    assert len(small) == len(large) == 32
+    pooled = sum(buffer.nbytes for free in finder._scratch._free.values() for buffer in free)
+    assert pooled == finder._scratch._bytes <= finder._scratch.max_bytes
+    assert all(capacity <= finder._scratch.max_points for capacity in finder._scratch._free)
+    assert len(finder._scratch._range) <= finder._scratch.max_points
+    assert finder._difference._local.buffers[0] <= finder._scratch.max_points
+
+
+@pytest.mark.parametrize("cache_size", [None, 1000])
+def test_reducing_callables_are_not_broadcast(cache_size):
+    # norm() of an array is not the norm of each point; the scan must notice.
+    finder = IntersectionFinder(lambda x: np.linalg.norm(x), lambda x: 2.0, cache_size=cache_size)
+    assert [x for x, _ in finder.find_intersections_by_scan((-5, 5), 100)] == \
+        pytest.approx([-2.0, 2.0])
+
+
+def test_reversed_domain_is_scanned_right_to_left():
+    finder = IntersectionFinder(np.sin, np.cos)
+    forward = [x for x, _ in finder.find_intersections_by_scan((0, 1000), 10000)]
+    backward = [x for x, _ in finder.find_intersections_by_scan((1000, 0), 10000)]
+    assert len(forward) == 319
+    np.testing.assert_allclose(backward, forward[::-1], atol=1e-6)
+    for method in ('find_intersections_chebyshev', 'find_intersections_interval'):
+        roots = [x for x, _ in getattr(finder, method)((20, 0))]
+        np.testing.assert_allclose(roots, [x for x in forward if x < 20][::-1], atol=1e-6)
+
+
+def test_adaptive_scan_does_not_refine_around_simple_roots():
+    calls = []
+
+    def sine(x):
+        calls.append(np.size(x))
+        return np.sin(x)
+
+    finder = IntersectionFinder(sine, lambda x: np.full(np.shape(x), 0.3))
+    roots = [x for x, _ in finder.find_intersections_adaptive((0, 100))]
+    expected = [x for x, _ in IntersectionFinder(np.sin, lambda x: 0.3 + 0 * x)
+                .find_intersections_by_scan((0, 100), 10000)]
+    np.testing.assert_allclose(roots, expected, atol=1e-6)
+    assert sum(calls) < 300
+
+
+def test_widening_an_incremental_scan_only_samples_the_new_region():
+    calls = []
+
+    def sine(x):
+        calls.append(np.size(x))
+        return np.sin(x)
+
+    finder = IntersectionFinder(sine, np.cos, scan_memory_points=3000)
+    first = finder.find_intersections_by_scan((0, 100), 1000, incremental=True)
+    calls.clear()
+    second = finder.find_intersections_by_scan((0, 200), 2000, incremental=True)
+    assert sum(calls) < 1300
+    assert [root for root in second if root[0] <= 100] == first
+    finder.find_intersections_by_scan((0, 100), 4000, incremental=True)
+    assert len(finder._scan_memory[None]['x']) <= 4000
+
+
+def test_released_gil_is_judged_against_the_available_cpus():
+    from main import ParallelReport
+    assert ParallelReport('thread', 4, 1.0, 3.5, cpus=8).released_gil is True
+    assert ParallelReport('thread', 4, 1.0, 1.1, cpus=8).released_gil is False
+    assert ParallelReport('thread', 4, 1.0, 1.7, cpus=2).released_gil is True
+    assert ParallelReport('thread', 4, 1.0, 0.98, cpus=1).released_gil is None
+    assert ParallelReport('process', 4, 1.0, 3.5, cpus=8).released_gil is None
+
+
+class CountingSine:
+    def __init__(self, frequency):
+        self.frequency = frequency
+        self.calls = 0
+
+    def __call__(self, x):
+        self.calls += 1
+        return np.sin(self.frequency * x)
+
+    def __fingerprint__(self):
+        return self.frequency
+
+
+def test_result_cache_ignores_state_behind_fingerprint_hook(tmp_path):
+    cache = ResultCache(tmp_path)
+    sine = CountingSine(2.0)
+    finder = IntersectionFinder(sine, np.cos, result_cache=cache)
+    first = finder.find_intersections_by_scan((0, 10), 1000)
+    calls = sine.calls
+    assert finder.find_intersections_by_scan((0, 10), 1000) == first
+    assert sine.calls == calls
+    assert len(list(tmp_path.iterdir())) == 1
+    assert cache.key(CountingSine(3.0), np.cos) != cache.key(sine, np.cos)
+
+
+@pytest.mark.parametrize("num_points", [0, 1])
+def test_grids_without_cells_find_nothing(num_points):
+    finder = IntersectionFinder(np.sin, np.cos)
+    assert finder.find_intersections_by_scan((0, 10), num_points) == []
+    assert finder.find_intersections_by_scan((0, 10), num_points, chunk_size=2) == []
+    assert list(finder.iter_intersections((0, 10), num_points)) == []
+    assert finder.find_intersections_by_scan((0, 10), num_points, incremental=True) == []
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+@pytest.mark.parametrize("pair", PAIRS)
+def test_engines_match_dense_brentq_scan(engine, pair):
+    func1, func2, domain = PAIRS[pair]
+    found = roots_of(ENGINES[engine](IntersectionFinder(func1, func2), domain))
+    np.testing.assert_allclose(found, dense_roots(func1, func2, domain), rtol=1e-9, atol=1e-6)
+
+
+@pytest.mark.parametrize("method", ['newton', 'halley'])
+@pytest.mark.parametrize("pair", PAIRS)
+def test_derivative_methods_match_dense_brentq_scan(method, pair):
+    func1, func2, domain = PAIRS[pair]
+    finder = IntersectionFinder(func1, func2, derivative='complex-step')
+    result = finder.find_intersections_by_scan(domain, 2000, method=method, structured=True)
+    np.testing.assert_allclose(result.x, dense_roots(func1, func2, domain), rtol=1e-9, atol=1e-6)
+    assert np.all(result.iterations < 50)
+
+
+def test_newton_uses_given_derivatives():
+    finder = IntersectionFinder(np.sin, np.cos, dfunc1=np.cos, dfunc2=lambda x: -np.sin(x))
+    found = roots_of(finder.find_intersections_by_scan((0, 20), 2000, method='newton'))
+    np.testing.assert_allclose(found, dense_roots(np.sin, np.cos, (0, 20)), atol=1e-9)
+
+
+def test_process_pool_matches_serial_scan():
+    finder = IntersectionFinder(np.sin, np.cos)
+    serial = finder.find_intersections_by_scan((0, 50), 5000)
+    np.testing.assert_allclose(roots_of(finder.find_intersections_parallel((0, 50), 5000,
+                                                                           partitions=3)),
+                               roots_of(serial), atol=1e-12)
+    assert finder.last_parallel_report.executor == 'process'
+
+
+@pytest.mark.parametrize("n, base, domain", [(10, np.e, (-10, 100)), (3, 2.0, (-10, 100)),
+                                             (2, 3.0, (-5, 5)), (4, 0.5, (-20, 20))])
+def test_closed_form_matches_dense_brentq_scan(n, base, domain):
+    finder = IntersectionFinder(Power(n), Exponential(base))
+    expected = dense_roots(lambda x: x ** n, lambda x: base ** x, domain)
+    np.testing.assert_allclose(roots_of(finder.find_intersections_by_scan(domain, 1000)),
+                               expected, rtol=1e-9, atol=1e-9)
+    numeric = finder.find_intersections_by_scan(domain, 20000, analytic=False)
+    np.testing.assert_allclose(roots_of(numeric), expected, rtol=1e-9, atol=1e-6)
+
+
+def test_touching_roots_are_reported():
+    finder = IntersectionFinder(lambda x: (x - 2) ** 2, lambda x: np.zeros(np.shape(x)))
+    assert finder.find_intersections_by_scan((0, 5), 1000) == []
+    touching = roots_of(finder.find_intersections_by_scan((0, 5), 1000, touching=True))
+    np.testing.assert_allclose(touching, [2.0], atol=1e-5)
+
+
+def test_log_transform_survives_overflow():
+    finder = IntersectionFinder(lambda x: x ** 10, np.exp)
+    found = roots_of(finder.find_intersections_by_scan((1, 5000), 10000, transform='log'))
+    np.testing.assert_allclose(found, [1.1183255915896297, 35.77152063957297], atol=1e-6)
+
+
+def test_interval_engine_prunes_without_sampling_everywhere():
+    calls = []
+
+    def line(x):
+        if isinstance(x, np.ndarray):
+            calls.append(x.size)
+        return 0.01 * x
+
+    # Crossings need 0.01 * x <= 1, so everything past x = 100 is pruned by enclosures
+    # and the sign test only samples a few points around each root.
+    found = roots_of(IntersectionFinder(line, np.cos).find_intersections_interval((0, 1000)))
+    np.testing.assert_allclose(found, dense_roots(lambda x: 0.01 * x, np.cos, (0, 1000),
+                                                  1000001), atol=1e-6)
+    assert sum(calls) < 10 * len(found)
+
+
+def test_batch_matches_each_pair_on_its_own():
+    n = np.arange(1, 6)
+    result = IntersectionFinder(lambda x: x ** n[:, None], np.exp).find_intersections_batch(
+        (-10, 40), 2000)
+    assert len(result.counts) == len(n)
+    for i, power in enumerate(n):
+        expected = dense_roots(lambda x: x ** power, np.exp, (-10, 40))
+        np.testing.assert_allclose(roots_of(result[i]), expected, rtol=1e-9, atol=1e-6)
+
+
+def test_pairwise_matches_each_pair_on_its_own():
+    curves = [np.sin, np.cos, lambda x: 0.1 * x]
+    intersections = find_pairwise_intersections(curves, (0, 10), 1000)
+    assert set(intersections) == {(0, 1), (0, 2), (1, 2)}
+    for (i, j), points in intersections.items():
+        expected = dense_roots(curves[i], curves[j], (0, 10))
+        np.testing.assert_allclose(roots_of(points), expected, atol=1e-6)
+        np.testing.assert_allclose([y for _, y in points], curves[i](roots_of(points)))
+
+
+def test_lru_cache_serves_repeated_scans_and_evicts():
+    finder = IntersectionFinder(np.sin, np.cos, cache_size=3000)
+    first = finder.find_intersections_by_scan((0, 20), 2000)
+    misses = finder.cache_info()['func1'].misses
+    assert finder.find_intersections_by_scan((0, 20), 2000) == first
+    info = finder.cache_info()['func1']
+    assert info.misses == misses and info.hits >= 2000
+    finder.find_intersections_by_scan((0, 30), 2000)
+    assert finder.cache_info()['func1'].currsize <= 3000
+    finder.cache_clear()
+    assert finder.cache_info()['func1'].currsize == 0
+
+
+def test_incremental_zoom_matches_fresh_scan():
+    finder = IntersectionFinder(np.sin, np.cos)
+    finder.find_intersections_by_scan((0, 100), 1000, incremental=True)
+    zoomed = finder.find_intersections_by_scan((40, 60), 2000, incremental=True)
+    fresh = IntersectionFinder(np.sin, np.cos).find_intersections_by_scan((40, 60), 2000)
+    np.testing.assert_allclose(roots_of(zoomed), roots_of(fresh), atol=1e-6)